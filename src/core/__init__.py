@@ -1,15 +1,32 @@
 """Core business logic"""
 
+from importlib import import_module
+
 from .state import PropertyListingState
-from .workflow import create_workflow
-from .nodes import (
-    input_guardrail_node,
-    enrich_data_node,
-    predict_price_node,
-    generate_content_node,
-    output_guardrail_node,
-    format_output_node,
-)
+
+# The workflow and nodes pull in LangGraph and the LLM/search utilities, so
+# they are imported on first access (PEP 562); importing only the state
+# schema stays cheap
+_LAZY_EXPORTS = {
+    "create_workflow": ".workflow",
+    "input_guardrail_node": ".nodes",
+    "enrich_data_node": ".nodes",
+    "predict_price_node": ".nodes",
+    "generate_content_node": ".nodes",
+    "output_guardrail_node": ".nodes",
+    "format_output_node": ".nodes",
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access and cache them."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "PropertyListingState",
@@ -21,4 +38,3 @@ __all__ = [
     "output_guardrail_node",
     "format_output_node",
 ]
-
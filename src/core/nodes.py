@@ -41,10 +41,7 @@ def input_guardrail_node(state: PropertyListingState) -> PropertyListingState:
     """
     print("[DEBUG] Node 1: input_guardrail_node - Starting combined validation and normalization")
     from utils.guardrails import detect_injection_attacks, MAX_ADDRESS_LENGTH, MAX_NOTES_LENGTH
-    from utils.validators import (
-        validate_address, validate_listing_type, validate_property_type,
-        validate_bedrooms, validate_bathrooms, validate_sqft, validate_notes
-    )
+    from utils.validators import validate_input_fields
     
     # Initialize errors list if not present
     if "errors" not in state:
@@ -65,55 +62,35 @@ def input_guardrail_node(state: PropertyListingState) -> PropertyListingState:
     # 1. SECURITY CHECKS (Injection attacks, text length)
     # ========================================================================
     
-    # Check for injection attacks
-    injection_error = detect_injection_attacks(address)
+    address_too_long = len(address) > MAX_ADDRESS_LENGTH
+    notes_too_long = len(notes) > MAX_NOTES_LENGTH
+    
+    # Check for injection attacks (oversized fields are rejected by the
+    # length check below, so they are not scanned)
+    injection_error = detect_injection_attacks(address) if not address_too_long else None
     if injection_error:
         errors.append(f"Address: {injection_error}")
     
-    injection_error = detect_injection_attacks(notes)
+    injection_error = detect_injection_attacks(notes) if not notes_too_long else None
     if injection_error:
         errors.append(f"Notes: {injection_error}")
     
     # Check text length limits
-    if len(address) > MAX_ADDRESS_LENGTH:
+    if address_too_long:
         errors.append(f"Address exceeds maximum length of {MAX_ADDRESS_LENGTH} characters (got {len(address)})")
     
-    if notes and len(notes) > MAX_NOTES_LENGTH:
+    if notes_too_long:
         errors.append(f"Notes exceed maximum length of {MAX_NOTES_LENGTH} characters (got {len(notes)})")
     
     # ========================================================================
     # 2. FIELD VALIDATION (Required fields, types, values)
     # ========================================================================
     
-    # Validate all required fields
-    address_error = validate_address(address)
-    if address_error:
-        errors.append(address_error)
-    
-    listing_type_error = validate_listing_type(listing_type)
-    if listing_type_error:
-        errors.append(listing_type_error)
-    
-    property_type_error = validate_property_type(property_type)
-    if property_type_error:
-        errors.append(property_type_error)
-    
-    bedrooms_error = validate_bedrooms(bedrooms)
-    if bedrooms_error:
-        errors.append(bedrooms_error)
-    
-    bathrooms_error = validate_bathrooms(bathrooms)
-    if bathrooms_error:
-        errors.append(bathrooms_error)
-    
-    sqft_error = validate_sqft(sqft)
-    if sqft_error:
-        errors.append(sqft_error)
-    
-    # Validate optional fields
-    notes_error = validate_notes(notes)
-    if notes_error:
-        errors.append(notes_error)
+    # Validate all required fields and the optional notes in one call
+    # (validate_input_fields runs the same validators in the same order)
+    errors.extend(validate_input_fields(
+        address, listing_type, property_type, bedrooms, bathrooms, sqft, notes
+    ))
     
     # ========================================================================
     # 3. TEXT NORMALIZATION (Trim whitespace, basic cleaning)
@@ -430,6 +407,20 @@ def predict_price_node(state: PropertyListingState) -> PropertyListingState:
     return updates
 
 
+# Optional state fields passed straight through to build_listing_generation_prompt
+# (missing fields are passed as None and the prompt skips their sections)
+_PROMPT_OPTIONAL_FIELDS = (
+    "notes",
+    "normalized_address",
+    "normalized_notes",
+    "zip_code",
+    "neighborhood",
+    "landmarks",
+    "key_amenities",
+    "neighborhood_quality",
+)
+
+
 def generate_content_node(state: PropertyListingState) -> PropertyListingState:
     """
     Node 3: Generate listing content using LLM.
@@ -503,15 +494,8 @@ def generate_content_node(state: PropertyListingState) -> PropertyListingState:
             bedrooms=bedrooms,
             bathrooms=bathrooms,
             sqft=sqft,
-            notes=state.get("notes"),
-            normalized_address=state.get("normalized_address"),
-            normalized_notes=state.get("normalized_notes"),
-            zip_code=state.get("zip_code"),
-            neighborhood=state.get("neighborhood"),
-            landmarks=state.get("landmarks"),
-            key_amenities=state.get("key_amenities"),
-            neighborhood_quality=state.get("neighborhood_quality"),
             region=state.get("region", "US"),
+            **{field: state.get(field) for field in _PROMPT_OPTIONAL_FIELDS},
         )
         
         # Store prompt building metrics
@@ -12,8 +12,14 @@ The enrichment uses multiple targeted searches to avoid ambiguous results
 and extract structured information.
 """
 
+import copy
 import re
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Tavily import - may not be available in test environment
@@ -24,6 +30,17 @@ except ImportError:
     TavilySearch = None
 
 
+# ============================================================================
+# Precompiled Patterns
+# ============================================================================
+
+# ZIP code: 5 digits, optionally followed by -4 digits; group 1 is the 5-digit part
+_ZIP_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\b')
+
+# Runs of whitespace (collapsed to a single space when cleaning names)
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+
 # ============================================================================
 # Search Query Construction
 # ============================================================================
@@ -72,6 +89,7 @@ def extract_keywords_from_notes(notes: str) -> List[str]:
     return keywords
 
 
+@lru_cache(maxsize=512)
 def build_neighborhood_quality_search_query(address: str) -> str:
     """
     Build search query for neighborhood quality information.
@@ -90,6 +108,7 @@ def build_neighborhood_quality_search_query(address: str) -> str:
     return query.strip()
 
 
+@lru_cache(maxsize=512)
 def build_landmarks_search_query(
     address: str,
     notes: str = "",
@@ -131,57 +150,7 @@ def build_landmarks_search_query(
     return query.strip()
 
 
-def build_amenities_search_query(
-    address: str,
-    amenity_type: str,
-    notes: str = "",
-    listing_type: Optional[str] = None
-) -> str:
-    """
-    Build search query for specific amenity type.
-    
-    Intelligently constructs query based on address, notes, and listing type.
-    For rentals, transportation might be more important. For sales, schools might be prioritized.
-    
-    Args:
-        address: Property address
-        amenity_type: Type of amenity ("schools", "parks", "shopping", "transportation")
-        notes: Normalized notes (optional, may mention specific amenities)
-        listing_type: "sale" or "rent" (optional, affects query focus)
-        
-    Returns:
-        Search query string
-    """
-    query_parts = [address]
-    
-    amenity_keywords = {
-        "schools": "schools education",
-        "parks": "parks recreation",
-        "shopping": "shopping malls stores",
-        "transportation": "subway metro bus transportation public transit"
-    }
-    
-    keywords = amenity_keywords.get(amenity_type, amenity_type)
-    query_parts.append(keywords)
-    
-    # If notes mention this amenity type, add context
-    if notes:
-        notes_lower = notes.lower()
-        if amenity_type in notes_lower or keywords.split()[0] in notes_lower:
-            query_parts.append("nearby")
-    
-    # Add listing-type specific context
-    if listing_type == "rent":
-        if amenity_type == "transportation":
-            query_parts.append("public transit access")
-    elif listing_type == "sale":
-        if amenity_type == "schools":
-            query_parts.append("school district ratings")
-    
-    query = " ".join(query_parts)
-    return query.strip()
-
-
+@lru_cache(maxsize=512)
 def build_amenities_search_query(address: str) -> str:
     """
     Build search query for nearby amenities.
@@ -220,12 +189,9 @@ def parse_zip_code_from_address(address: str) -> Optional[str]:
     if not address:
         return None
     
-    # Pattern: 5 digits (optionally followed by -4 digits)
     # Look for ZIP code at the end of address (common format: "City, ST ZIP")
-    zip_pattern = r'\b(\d{5})(?:-\d{4})?\b'
-    
     # Try to find ZIP code (usually at the end)
-    matches = re.findall(zip_pattern, address)
+    matches = _ZIP_RE.findall(address)
     if matches:
         # Return the last match (most likely the actual ZIP code)
         return matches[-1]
@@ -279,22 +245,33 @@ def extract_zip_code(search_results: List[Dict[str, Any]]) -> Optional[str]:
     Returns:
         ZIP code string if found, None otherwise
     """
-    zip_pattern = r'\b\d{5}(?:-\d{4})?\b'  # 5 digits or 5+4 format
-    
     for result in search_results:
         content = result.get("content", "")
-        # Look for ZIP code pattern
-        matches = re.findall(zip_pattern, content)
-        if matches:
-            # Return first valid ZIP code (5 digits)
-            for match in matches:
-                zip_code = match.split("-")[0]  # Take first 5 digits
-                if len(zip_code) == 5 and zip_code.isdigit():
-                    return zip_code
+        # Look for ZIP code pattern (5 digits or 5+4 format)
+        match = _ZIP_RE.search(content)
+        if match:
+            # Return first ZIP code (group 1 is always the first 5 digits)
+            return match.group(1)
     
     return None
 
 
+# Invalid words that should never be used as neighborhood names
+_INVALID_NEIGHBORHOOD_WORDS = frozenset([
+    "what", "where", "when", "who", "why", "how", "which", "this", "that",
+    "the", "and", "or", "for", "with", "from", "about", "into", "onto",
+    "area", "neighborhood", "location", "place", "city", "state", "zip",
+    "code", "street", "avenue", "road", "drive", "lane", "boulevard"
+])
+
+# Patterns for neighborhood names ("in X", "X neighborhood", "neighborhood: X")
+_NEIGHBORHOOD_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:in|located in|neighborhood of|area of)\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
+    r'([A-Z][a-zA-Z\s]+?)\s+neighborhood',
+    r'neighborhood:\s*([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
+))
+
+
 def extract_neighborhood(search_results: List[Dict[str, Any]], address: str) -> Optional[str]:
     """
     Extract neighborhood name from search results.
@@ -309,20 +286,6 @@ def extract_neighborhood(search_results: List[Dict[str, Any]], address: str) ->
     Returns:
         Neighborhood name if found, None otherwise
     """
-    # Invalid words that should never be used as neighborhood names
-    INVALID_NEIGHBORHOOD_WORDS = [
-        "what", "where", "when", "who", "why", "how", "which", "this", "that",
-        "the", "and", "or", "for", "with", "from", "about", "into", "onto",
-        "area", "neighborhood", "location", "place", "city", "state", "zip",
-        "code", "street", "avenue", "road", "drive", "lane", "boulevard"
-    ]
-    
-    neighborhood_patterns = [
-        r'(?:in|located in|neighborhood of|area of)\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
-        r'([A-Z][a-zA-Z\s]+?)\s+neighborhood',
-        r'neighborhood:\s*([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
-    ]
-    
     for result in search_results:
         content = result.get("content", "") or ""
         title = result.get("title", "") or ""
@@ -333,27 +296,27 @@ def extract_neighborhood(search_results: List[Dict[str, Any]], address: str) ->
             continue
         
         # Look for neighborhood patterns
-        for pattern in neighborhood_patterns:
+        for pattern in _NEIGHBORHOOD_PATTERNS:
             try:
-                matches = re.findall(pattern, combined_text, re.IGNORECASE)
+                matches = pattern.findall(combined_text)
                 if matches:
                     # Return first match that looks like a neighborhood name
                     for match in matches:
                         neighborhood = match.strip()
                         # Clean up newlines and extra whitespace
-                        neighborhood = re.sub(r'\s+', ' ', neighborhood)  # Normalize whitespace
+                        neighborhood = _WHITESPACE_RUN_RE.sub(' ', neighborhood)  # Normalize whitespace
                         neighborhood = neighborhood.strip()
                         
                         # Validate neighborhood name
                         neighborhood_lower = neighborhood.lower()
                         
                         # Filter out invalid words
-                        if neighborhood_lower in INVALID_NEIGHBORHOOD_WORDS:
+                        if neighborhood_lower in _INVALID_NEIGHBORHOOD_WORDS:
                             continue
                         
                         # Check if it contains invalid words
                         words = neighborhood_lower.split()
-                        if any(word in INVALID_NEIGHBORHOOD_WORDS for word in words):
+                        if not _INVALID_NEIGHBORHOOD_WORDS.isdisjoint(words):
                             continue
                         
                         # Filter out common false positives
@@ -368,6 +331,14 @@ def extract_neighborhood(search_results: List[Dict[str, Any]], address: str) ->
     return None
 
 
+# Landmark indicators (case-sensitive so names must be capitalized)
+_LANDMARK_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'([A-Z][a-zA-Z\s]+?)\s+(?:Park|Museum|Plaza|Square|Center|Tower|Bridge|Monument)',
+    r'near\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
+    r'close to\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
+))
+
+
 def extract_landmarks(search_results: List[Dict[str, Any]], max_landmarks: int = 5) -> List[str]:
     """
     Extract nearby landmarks from search results.
@@ -388,14 +359,8 @@ def extract_landmarks(search_results: List[Dict[str, Any]], max_landmarks: int =
         title = result.get("title", "")
         
         # Look for landmark indicators
-        landmark_indicators = [
-            r'([A-Z][a-zA-Z\s]+?)\s+(?:Park|Museum|Plaza|Square|Center|Tower|Bridge|Monument)',
-            r'near\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
-            r'close to\s+([A-Z][a-zA-Z\s]+?)(?:,|\.|$)',
-        ]
-        
-        for pattern in landmark_indicators:
-            matches = re.findall(pattern, content + " " + title)
+        for pattern in _LANDMARK_PATTERNS:
+            matches = pattern.findall(content + " " + title)
             for match in matches:
                 landmark = match.strip()
                 if len(landmark) > 3 and len(landmark) < 50:
@@ -407,6 +372,26 @@ def extract_landmarks(search_results: List[Dict[str, Any]], max_landmarks: int =
     return landmarks[:max_landmarks]
 
 
+# Patterns to extract crime and safety information
+_CRIME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'crime rate[:\s]+([^\.]+)',
+    r'safety[:\s]+([^\.]+)',
+    r'crime statistics[:\s]+([^\.]+)',
+))
+
+# Patterns to extract quality of life information
+_QUALITY_OF_LIFE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'quality of life[:\s]+([^\.]+)',
+    r'livability[:\s]+([^\.]+)',
+    r'neighborhood rating[:\s]+([^\.]+)',
+))
+
+# Safety keywords as one alternation (one scan per sentence instead of one per keyword)
+_SAFETY_KEYWORD_RE = re.compile("|".join(map(re.escape, (
+    "safe", "safety", "secure", "low crime", "well-maintained"
+))))
+
+
 def extract_neighborhood_quality(search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Extract neighborhood quality information from search results.
@@ -436,20 +421,6 @@ def extract_neighborhood_quality(search_results: List[Dict[str, Any]]) -> Dict[s
         "neighborhood": None
     }
     
-    # Patterns to extract crime and safety information
-    crime_patterns = [
-        r'crime rate[:\s]+([^\.]+)',
-        r'safety[:\s]+([^\.]+)',
-        r'crime statistics[:\s]+([^\.]+)',
-    ]
-    
-    # Patterns to extract quality of life information
-    quality_patterns = [
-        r'quality of life[:\s]+([^\.]+)',
-        r'livability[:\s]+([^\.]+)',
-        r'neighborhood rating[:\s]+([^\.]+)',
-    ]
-    
     # Try to extract neighborhood name
     neighborhood = extract_neighborhood(search_results, "")
     if neighborhood:
@@ -466,8 +437,8 @@ def extract_neighborhood_quality(search_results: List[Dict[str, Any]]) -> Dict[s
     
     # Extract crime/safety information
     crime_snippets = []
-    for pattern in crime_patterns:
-        matches = re.findall(pattern, combined_text, re.IGNORECASE)
+    for pattern in _CRIME_PATTERNS:
+        matches = pattern.findall(combined_text)
         crime_snippets.extend(matches[:2])  # Take first 2 matches
     
     if crime_snippets:
@@ -475,19 +446,18 @@ def extract_neighborhood_quality(search_results: List[Dict[str, Any]]) -> Dict[s
     
     # Extract quality of life information
     quality_snippets = []
-    for pattern in quality_patterns:
-        matches = re.findall(pattern, combined_text, re.IGNORECASE)
+    for pattern in _QUALITY_OF_LIFE_PATTERNS:
+        matches = pattern.findall(combined_text)
         quality_snippets.extend(matches[:2])
     
     if quality_snippets:
         quality_info["quality_of_life"] = ". ".join(quality_snippets[:3])[:200]
     
     # Extract general safety information
-    safety_keywords = ["safe", "safety", "secure", "low crime", "well-maintained"]
     safety_snippets = []
     sentences = combined_text.split('.')
     for sentence in sentences:
-        if any(keyword in sentence for keyword in safety_keywords):
+        if _SAFETY_KEYWORD_RE.search(sentence):
             if len(sentence.strip()) > 20:  # Only meaningful sentences
                 safety_snippets.append(sentence.strip()[:150])
                 if len(safety_snippets) >= 2:
@@ -498,6 +468,40 @@ def extract_neighborhood_quality(search_results: List[Dict[str, Any]]) -> Dict[s
     return quality_info
 
 
+# Patterns for different amenity types (improved to capture actual names)
+_AMENITY_PATTERNS = {
+    "schools": tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+(?:School|Elementary|High School|Academy|Middle School)',
+        r'(?:PS|Public School|P\.S\.)\s+(\d+)',
+        r'([A-Z][a-zA-Z\s]+?)\s+Elementary',
+        r'([A-Z][a-zA-Z\s]+?)\s+High',
+    )),
+    "supermarkets": tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+(?:Supermarket|Grocery|Market|Whole Foods|Trader Joe|Walmart|Target|Kroger|Safeway)',
+        r'(?:Whole Foods|Trader Joe\'s?|Walmart|Target|Kroger|Safeway|Stop & Shop)',
+    )),
+    "parks": tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+Park',
+        r'([A-Z][a-zA-Z\s]+?)\s+Playground',
+        r'([A-Z][a-zA-Z\s]+?)\s+Recreation\s+Area',
+    )),
+    "transportation": tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:Subway|Metro|Bus)\s+(?:Line|Station):\s*([A-Z0-9\s,]+)',
+        r'([A-Z0-9]+)\s+(?:line|station)',
+        r'(?:near|at)\s+([A-Z][a-zA-Z\s]+?)\s+(?:Subway|Metro|Bus)\s+Station',
+    )),
+}
+
+# Words to filter out (HTML artifacts, generic text, invalid words), matched as
+# case-insensitive substrings in one alternation
+_AMENITY_FILTER_RE = re.compile("|".join(map(re.escape, (
+    "overview", "website", "contacts", "information", "school website",
+    "click", "here", "more", "details", "page", "home", "about",
+    "contact", "menu", "navigation", "search", "login", "sign up",
+    "what", "where", "when", "who", "why", "how", "which", "this", "that"
+))), re.IGNORECASE)
+
+
 def extract_amenities(
     search_results: List[Dict[str, Any]], 
     amenity_type: str = None,  # Now optional - we extract all amenities from combined results
@@ -530,38 +534,6 @@ def extract_amenities(
         "transportation": []
     }
     
-    # Patterns for different amenity types (improved to capture actual names)
-    patterns = {
-        "schools": [
-            r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+(?:School|Elementary|High School|Academy|Middle School)',
-            r'(?:PS|Public School|P\.S\.)\s+(\d+)',
-            r'([A-Z][a-zA-Z\s]+?)\s+Elementary',
-            r'([A-Z][a-zA-Z\s]+?)\s+High',
-        ],
-        "supermarkets": [
-            r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+(?:Supermarket|Grocery|Market|Whole Foods|Trader Joe|Walmart|Target|Kroger|Safeway)',
-            r'(?:Whole Foods|Trader Joe\'s?|Walmart|Target|Kroger|Safeway|Stop & Shop)',
-        ],
-        "parks": [
-            r'([A-Z][a-zA-Z0-9\s&\'-]+?)\s+Park',
-            r'([A-Z][a-zA-Z\s]+?)\s+Playground',
-            r'([A-Z][a-zA-Z\s]+?)\s+Recreation\s+Area',
-        ],
-        "transportation": [
-            r'(?:Subway|Metro|Bus)\s+(?:Line|Station):\s*([A-Z0-9\s,]+)',
-            r'([A-Z0-9]+)\s+(?:line|station)',
-            r'(?:near|at)\s+([A-Z][a-zA-Z\s]+?)\s+(?:Subway|Metro|Bus)\s+Station',
-        ],
-    }
-    
-    # Words to filter out (HTML artifacts, generic text, invalid words)
-    filter_words = [
-        "overview", "website", "contacts", "information", "school website",
-        "click", "here", "more", "details", "page", "home", "about",
-        "contact", "menu", "navigation", "search", "login", "sign up",
-        "what", "where", "when", "who", "why", "how", "which", "this", "that"
-    ]
-    
     # Extract all amenity types from combined search results
     for result_idx, result in enumerate(search_results, 1):
         content = result.get("content", "") or ""
@@ -569,12 +541,12 @@ def extract_amenities(
         combined_text = f"{title} {content}"
         
         # Extract each amenity type
-        for amenity_type, pattern_list in patterns.items():
+        for amenity_type, pattern_list in _AMENITY_PATTERNS.items():
             if len(amenities_by_type[amenity_type]) >= max_items:
                 continue  # Already have enough of this type
             
             for pattern in pattern_list:
-                matches = re.findall(pattern, combined_text, re.IGNORECASE)
+                matches = pattern.findall(combined_text)
                 for match in matches:
                     amenity = match.strip() if isinstance(match, str) else str(match).strip()
                     
@@ -583,8 +555,7 @@ def extract_amenities(
                         continue
                     
                     # Filter out HTML artifacts and generic text
-                    amenity_lower = amenity.lower()
-                    if any(filter_word in amenity_lower for filter_word in filter_words):
+                    if _AMENITY_FILTER_RE.search(amenity):
                         continue
                     
                     # Filter out results that are just numbers or single words (unless it's a school number)
@@ -592,7 +563,7 @@ def extract_amenities(
                         continue
                     
                     # Clean up common artifacts
-                    amenity = re.sub(r'\s+', ' ', amenity)  # Normalize whitespace
+                    amenity = _WHITESPACE_RUN_RE.sub(' ', amenity)  # Normalize whitespace
                     amenity = amenity.strip()
                     
                     if amenity and amenity not in amenities_by_type[amenity_type]:
@@ -641,7 +612,7 @@ def perform_tavily_search(
     """
     try:
         # Import tracing utilities
-        from .tracing import trace_web_search, set_trace_metadata
+        from .tracing import trace_web_search, append_trace_metadata
         
         # Use tracing wrapper to track web search execution
         results_list, metrics = trace_web_search(
@@ -651,12 +622,9 @@ def perform_tavily_search(
         )
         
         # Store web search metrics in trace metadata
-        # Use a list to track multiple searches
-        from .tracing import get_trace_metadata
-        existing_metadata = get_trace_metadata()
-        existing_searches = existing_metadata.get("web_searches", [])
-        existing_searches.append(metrics)
-        set_trace_metadata("web_searches", existing_searches)
+        # Use a list to track multiple searches (appended under a lock, since
+        # the enrichment searches run in parallel worker threads)
+        append_trace_metadata("web_searches", metrics)
         
         return results_list
     except Exception as e:
@@ -672,7 +640,7 @@ def perform_tavily_search(
 
 
 # ============================================================================
-# Comprehensive Enrichment (Legacy - 6 searches, kept for future use)
+# Comprehensive Enrichment (Legacy - 3 parallel searches, kept for future use)
 # ============================================================================
 
 def enrich_property_data_comprehensive(
@@ -683,13 +651,13 @@ def enrich_property_data_comprehensive(
     search_tool: Any = None
 ) -> Dict[str, Any]:
     """
-    LEGACY: Comprehensive enrichment with 6 sequential searches.
+    LEGACY: Comprehensive enrichment with parallel searches.
     
     This function is kept for future use if comprehensive enrichment is needed.
-    It performs 6 separate searches:
+    It runs these searches concurrently:
     1. Neighborhood & ZIP code
     2. Landmarks
-    3-6. Individual amenity searches (schools, parks, shopping, transportation)
+    3. Amenities (schools, parks, shopping, transportation from one search)
     
     To use this instead of the optimized version, call this function directly
     or set use_comprehensive=True in enrich_property_data().
@@ -697,7 +665,8 @@ def enrich_property_data_comprehensive(
     Args:
         address: Property address (normalized, preferred)
         notes: Normalized notes (optional, may contain location/amenity hints)
-        listing_type: "sale" or "rent" (optional, affects search priorities)
+        listing_type: "sale" or "rent" (optional, kept for compatibility; all
+            searches now run concurrently so there is no priority order)
         price: Property price (optional, can help understand neighborhood)
         search_tool: TavilySearch tool instance
         
@@ -727,75 +696,55 @@ def enrich_property_data_comprehensive(
         }
     }
     
+    # Build all queries up front so the web searches can run concurrently
+    # Note: Legacy function - using address only for queries
     # Search 1: Neighborhood and ZIP code
-    # Use address + notes context to find neighborhood
-    # WEB SEARCH #1: Executes here via perform_tavily_search()
-    # Note: Legacy function - using neighborhood quality search query (address only)
-    try:
-        neighborhood_query = build_neighborhood_quality_search_query(address)
-        # This call executes an actual web search via Tavily API
-        neighborhood_results = perform_tavily_search(neighborhood_query, search_tool)
-        
-        if neighborhood_results:
-            zip_code = extract_zip_code(neighborhood_results)
-            if zip_code:
-                enrichment_data["zip_code"] = zip_code
-            
-            neighborhood = extract_neighborhood(neighborhood_results, address)
-            if neighborhood:
-                enrichment_data["neighborhood"] = neighborhood
-    except Exception:
-        # Continue if this search fails
-        pass
-    
     # Search 2: Landmarks
-    # Use address only to find relevant landmarks
-    # WEB SEARCH #2: Executes here via perform_tavily_search()
-    # Note: Legacy function - using address only
-    try:
-        landmarks_query = f"{address} nearby landmarks attractions points of interest"
-        # This call executes an actual web search via Tavily API
-        landmarks_results = perform_tavily_search(landmarks_query, search_tool)
+    # Searches 3-6: Amenities - every category used the same address-only
+    # query, so it is searched once and each category is extracted from it
+    queries = {
+        "neighborhood": build_neighborhood_quality_search_query(address),
+        "landmarks": f"{address} nearby landmarks attractions points of interest",
+        "amenities": build_amenities_search_query(address),
+    }
+    
+    # Execute the searches in parallel (wall time is the slowest search,
+    # not the sum of all of them)
+    # (submitted with the caller's trace context so search metrics reach
+    # the request's trace metadata)
+    from .tracing import submit_with_trace_context
+    search_results = {}
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = {
+            name: submit_with_trace_context(executor, perform_tavily_search, query, search_tool)
+            for name, query in queries.items()
+        }
+        for name, future in futures.items():
+            try:
+                search_results[name] = future.result(timeout=30)
+            except Exception:
+                # Continue if this search fails
+                search_results[name] = []
+    
+    neighborhood_results = search_results["neighborhood"]
+    if neighborhood_results:
+        zip_code = extract_zip_code(neighborhood_results)
+        if zip_code:
+            enrichment_data["zip_code"] = zip_code
         
-        if landmarks_results:
-            landmarks = extract_landmarks(landmarks_results, max_landmarks=5)
-            enrichment_data["landmarks"] = landmarks
-    except Exception:
-        # Continue if this search fails
-        pass
-    
-    # Search 3-6: Amenities (one search per category)
-    # Prioritize amenities based on listing_type:
-    # - Rentals: prioritize transportation
-    # - Sales: prioritize schools
-    amenity_types = ["schools", "parks", "shopping", "transportation"]
-    
-    # Reorder based on listing type priority
-    if listing_type == "rent":
-        # For rentals, transportation is more important
-        amenity_types = ["transportation", "schools", "parks", "shopping"]
-    elif listing_type == "sale":
-        # For sales, schools are more important
-        amenity_types = ["schools", "parks", "shopping", "transportation"]
-    
-    # Searches 3-6: Amenities (one web search per amenity type)
-    # WEB SEARCHES #3, #4, #5, #6: Execute here via perform_tavily_search() in loop
-    # Note: Legacy function - using address only for queries
-    for amenity_type in amenity_types:
-        try:
-            # Use address-only query (legacy function)
-            amenity_query = build_amenities_search_query(address)
-            # Extract all amenities from combined results
-            # This call executes an actual web search via Tavily API (4 times total)
-            amenity_results = perform_tavily_search(amenity_query, search_tool)
-            
-            if amenity_results:
-                # Extract all amenities and get the specific type we need
-                all_amenities = extract_amenities(amenity_results, max_items=3)
-                enrichment_data["key_amenities"][amenity_type] = all_amenities.get(amenity_type, [])
-        except Exception:
-            # Continue if this search fails
-            pass
+        neighborhood = extract_neighborhood(neighborhood_results, address)
+        if neighborhood:
+            enrichment_data["neighborhood"] = neighborhood
+    
+    if search_results["landmarks"]:
+        enrichment_data["landmarks"] = extract_landmarks(search_results["landmarks"], max_landmarks=5)
+    
+    amenity_results = search_results["amenities"]
+    if amenity_results:
+        # Extract all amenities and keep the categories this structure reports
+        all_amenities = extract_amenities(amenity_results, max_items=3)
+        for amenity_type in enrichment_data["key_amenities"]:
+            enrichment_data["key_amenities"][amenity_type] = all_amenities.get(amenity_type, [])
     
     return enrichment_data
 
@@ -804,6 +753,19 @@ def enrich_property_data_comprehensive(
 # Optimized Enrichment (2 parallel searches - CURRENT IMPLEMENTATION)
 # ============================================================================
 
+# Maximum number of addresses kept in the enrichment result cache
+_ENRICHMENT_CACHE_SIZE = 1024
+
+# Seconds a cached enrichment result is served before the address is searched again
+_ENRICHMENT_CACHE_TTL = 3600.0
+
+# (address, search tool type) -> (expiry time, enrichment data), in
+# least-recently-used order. Keyed on the tool's type rather than the
+# instance because enrich_data_node builds a new tool for every request.
+_enrichment_cache: "OrderedDict[Tuple[str, type], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_enrichment_cache_lock = threading.Lock()
+
+
 def enrich_property_data(
     address: str,
     search_tool: Any = None
@@ -842,9 +804,64 @@ def enrich_property_data(
                 "transportation": List[str]
             }
         }
+    
+    Results are cached per address and search tool type (LRU, see
+    _ENRICHMENT_CACHE_SIZE) for _ENRICHMENT_CACHE_TTL seconds, so a repeated
+    address skips both web searches. Callers get their own copy of the
+    cached data. A result is only cached when both searches returned
+    results; if either failed, timed out or came back empty, the next call
+    searches again. An empty address returns the empty structure without
+    building queries or searching.
     """
-    # Initialize enrichment data structure
-    enrichment_data = {
+    if not address or not address.strip():
+        return _empty_enrichment_data()
+    
+    cache_key = (address, type(search_tool))
+    now = time.monotonic()
+    with _enrichment_cache_lock:
+        entry = _enrichment_cache.get(cache_key)
+        if entry is not None:
+            if entry[0] > now:
+                _enrichment_cache.move_to_end(cache_key)
+            else:
+                del _enrichment_cache[cache_key]
+                entry = None
+    if entry is not None:
+        print(f"[DEBUG] Enrichment: Cache hit for address, skipping web searches")
+        return copy.deepcopy(entry[1])
+    
+    enrichment_data, complete = _enrich_property_data_uncached(address, search_tool)
+    
+    if complete:
+        with _enrichment_cache_lock:
+            _enrichment_cache[cache_key] = (now + _ENRICHMENT_CACHE_TTL, copy.deepcopy(enrichment_data))
+            _enrichment_cache.move_to_end(cache_key)
+            if len(_enrichment_cache) > _ENRICHMENT_CACHE_SIZE:
+                _enrichment_cache.popitem(last=False)
+    
+    return enrichment_data
+
+
+# Shared read-only results for a failed or empty search. These are only read
+# inside _enrich_property_data_uncached and never returned, so one instance
+# serves every failure instead of a new dict per error.
+_NO_AMENITIES = MappingProxyType({
+    "schools": [],
+    "supermarkets": [],
+    "parks": [],
+    "transportation": []
+})
+_NO_NEIGHBORHOOD_QUALITY = MappingProxyType({
+    "crime_info": None,
+    "quality_of_life": None,
+    "safety_info": None,
+    "neighborhood": None
+})
+
+
+def _empty_enrichment_data() -> Dict[str, Any]:
+    """Return a fresh enrichment structure with nothing found."""
+    return {
         "zip_code": None,
         "neighborhood": None,
         "neighborhood_quality": {
@@ -859,6 +876,27 @@ def enrich_property_data(
             "transportation": []
         }
     }
+
+
+def clear_enrichment_cache() -> None:
+    """Drop all cached enrichment results (used by tests)."""
+    with _enrichment_cache_lock:
+        _enrichment_cache.clear()
+
+
+def _enrich_property_data_uncached(
+    address: str,
+    search_tool: Any = None
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Run the two enrichment web searches for enrich_property_data (no caching).
+    
+    Returns:
+        (enrichment_data, complete), where complete is True only if both
+        searches returned results (no error, timeout or empty response)
+    """
+    # Initialize enrichment data structure
+    enrichment_data = _empty_enrichment_data()
     
     # Step 1: Parse ZIP code from address (not from web search)
     zip_code = parse_zip_code_from_address(address)
@@ -910,12 +948,7 @@ def enrich_property_data(
             print(f"[WEB SEARCH 1] ERROR: {type(e).__name__}: {str(e)}\n")
             import traceback
             traceback.print_exc()
-            return {
-                "schools": [],
-                "supermarkets": [],
-                "parks": [],
-                "transportation": []
-            }
+        return _NO_AMENITIES
     
     def execute_neighborhood_quality_search():
         """Execute neighborhood quality search (WEB SEARCH CALL 2)"""
@@ -946,43 +979,32 @@ def enrich_property_data(
             print(f"[WEB SEARCH 2] ERROR: {type(e).__name__}: {str(e)}\n")
             import traceback
             traceback.print_exc()
-        return {
-            "crime_info": None,
-            "quality_of_life": None,
-            "safety_info": None,
-            "neighborhood": None
-        }
+        return _NO_NEIGHBORHOOD_QUALITY
     
-    # Execute both searches in parallel
+    # Execute both searches in parallel (with the caller's trace context, so
+    # search metrics reach the request's trace metadata)
+    from .tracing import submit_with_trace_context
     with ThreadPoolExecutor(max_workers=2) as executor:
-        amenities_future = executor.submit(execute_amenities_search)
-        quality_future = executor.submit(execute_neighborhood_quality_search)
+        amenities_future = submit_with_trace_context(executor, execute_amenities_search)
+        quality_future = submit_with_trace_context(executor, execute_neighborhood_quality_search)
         
         # Wait for both to complete and collect results
         try:
             amenities_result = amenities_future.result(timeout=30)
         except Exception as e:
             print(f"[WEB SEARCH 1] Timeout/Error: {e}")
-            amenities_result = {
-                "schools": [],
-                "supermarkets": [],
-                "parks": [],
-                "transportation": []
-            }
+            amenities_result = _NO_AMENITIES
         
         try:
             quality_result = quality_future.result(timeout=30)
         except Exception as e:
             print(f"[WEB SEARCH 2] Timeout/Error: {e}")
-            quality_result = {
-                "crime_info": None,
-                "quality_of_life": None,
-                "safety_info": None,
-                "neighborhood": None
-            }
+            quality_result = _NO_NEIGHBORHOOD_QUALITY
         
-        # Store amenities
-        enrichment_data["key_amenities"] = amenities_result
+        # Store amenities (the sentinel is never stored; the initial empty
+        # structure already says the same thing and is safe to mutate)
+        if amenities_result is not _NO_AMENITIES:
+            enrichment_data["key_amenities"] = amenities_result
         
         # Store neighborhood quality information
         enrichment_data["neighborhood_quality"] = {
@@ -998,5 +1020,7 @@ def enrich_property_data(
     print(f"[DEBUG] Enrichment: Completed 2 web searches")
     print(f"[DEBUG] Enrichment: Found {len(amenities_result.get('schools', []))} schools, {len(amenities_result.get('supermarkets', []))} supermarkets, {len(amenities_result.get('parks', []))} parks, {len(amenities_result.get('transportation', []))} transportation options")
     
-    return enrichment_data
+    # The searches fall back to the shared sentinels on error, timeout or no results
+    complete = amenities_result is not _NO_AMENITIES and quality_result is not _NO_NEIGHBORHOOD_QUALITY
+    return enrichment_data, complete
 
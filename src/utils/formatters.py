@@ -200,9 +200,12 @@ def format_listing(
     if has_any_price:
         parts.append("**Pricing Information:**")
         
+        # Lowercase the listing type once for both price labels
+        is_rental = bool(listing_type) and listing_type.lower() == "rent"
+        
         # Show user-provided price if available
         if seller_price is not None:
-            if listing_type and listing_type.lower() == "rent":
+            if is_rental:
                 user_price_label = "Monthly Rent:"
             else:
                 user_price_label = "Asking Price:"
@@ -211,7 +214,7 @@ def format_listing(
         
         # Show predicted price if available
         if predicted_price is not None:
-            if listing_type and listing_type.lower() == "rent":
+            if is_rental:
                 predicted_price_label = "Predicted Monthly Rental:"
             else:
                 predicted_price_label = "Predicted Price:"
@@ -42,6 +42,34 @@ PROPERTY_KEYWORDS = [
     "br", "ba", "bd", "bath", "bed", "sq", "ft", "$"
 ]
 
+
+def _property_keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Compile the match rule validate_property_related uses for one keyword."""
+    if keyword == "$":
+        # Special handling for dollar sign (plain substring)
+        return re.compile(re.escape(keyword))
+    if len(keyword) <= 2:
+        # Short abbreviations only count after a number, e.g. "3br", "2ba"
+        return re.compile(r'\d+' + re.escape(keyword) + r'\b', re.IGNORECASE)
+    # Longer keywords use word boundaries to avoid partial matches
+    return re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
+
+
+# One compiled pattern per PROPERTY_KEYWORDS entry (same order, duplicates kept
+# so keyword counts are unchanged)
+_PROPERTY_KEYWORD_RES = tuple(_property_keyword_pattern(keyword) for keyword in PROPERTY_KEYWORDS)
+
+# Location terms that make keyword-free text look like an address
+_ADDRESS_LOCATION_TERMS = (
+    'street', 'st', 'avenue', 'ave', 'road', 'rd', 'boulevard', 'blvd',
+    'drive', 'dr', 'lane', 'ln', 'way', 'court', 'ct', 'place', 'pl',
+    'bay', 'beach', 'park', 'hills', 'valley', 'creek', 'residency',
+    'residence', 'tower', 'building', 'complex', 'villa'
+)
+
+# Location terms as one alternation (plain substring match, like `term in text`)
+_ADDRESS_LOCATION_RE = re.compile("|".join(re.escape(term) for term in _ADDRESS_LOCATION_TERMS))
+
 # Inappropriate content keywords (basic list - can be expanded)
 INAPPROPRIATE_KEYWORDS = [
     # Explicit sexual content (basic list)
@@ -54,6 +82,13 @@ INAPPROPRIATE_KEYWORDS = [
     "scam", "fraud", "phishing", "spam",
 ]
 
+# All inappropriate keywords as one case-insensitive alternation, so a single
+# scan of the text replaces a substring check per keyword
+_INAPPROPRIATE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in INAPPROPRIATE_KEYWORDS),
+    re.IGNORECASE,
+)
+
 # Injection attack patterns
 INJECTION_PATTERNS = [
     # SQL injection patterns
@@ -68,6 +103,13 @@ INJECTION_PATTERNS = [
     r"(?i)(&&\s*cat|&&\s*ls|&&\s*rm|&&\s*sh|&&\s*bash)",
 ]
 
+# All injection patterns as one alternation compiled once at import, so each
+# field is scanned in a single pass (the inline (?i) flags become IGNORECASE)
+_INJECTION_RE = re.compile(
+    "|".join(f"(?:{pattern.removeprefix('(?i)')})" for pattern in INJECTION_PATTERNS),
+    re.IGNORECASE,
+)
+
 
 # ============================================================================
 # Text Length Validation
@@ -111,11 +153,13 @@ def detect_injection_attacks(text: str) -> Optional[str]:
     if not text:
         return None
     
-    text_lower = text.lower()
-    
-    for pattern in INJECTION_PATTERNS:
-        if re.search(pattern, text_lower):
-            return f"Potential injection attack detected in input"
+    return _injection_error(text.lower())
+
+
+def _injection_error(text_lower: str) -> Optional[str]:
+    """Injection check on text that has already been lowercased."""
+    if _INJECTION_RE.search(text_lower):
+        return f"Potential injection attack detected in input"
     
     return None
 
@@ -140,12 +184,9 @@ def detect_inappropriate_content(text: str) -> Optional[str]:
     if not text:
         return None
     
-    text_lower = text.lower()
-    
-    # Check for inappropriate keywords
-    for keyword in INAPPROPRIATE_KEYWORDS:
-        if keyword in text_lower:
-            return f"Inappropriate content detected in input"
+    # Check for inappropriate keywords (substring match, case-insensitive)
+    if _INAPPROPRIATE_RE.search(text):
+        return f"Inappropriate content detected in input"
     
     return None
 
@@ -173,34 +214,23 @@ def validate_property_related(text: str, min_keywords: int = 1) -> Optional[str]
     Returns:
         Error message if not property-related, None otherwise
     """
-    if not text or not text.strip():
+    return _property_related_error(text.lower() if text else "", min_keywords)
+
+
+def _property_related_error(text_lower: str, min_keywords: int) -> Optional[str]:
+    """Property-related check on text that has already been lowercased."""
+    if not text_lower.strip():
         # Empty text should fail property validation
         return f"Input does not appear to be property-related. Please provide property listing information."
     
-    text_lower = text.lower()
-    
-    # Count property-related keywords found
+    # Count property-related keywords found, stopping once enough are seen
     # Use word boundaries for better matching (handle abbreviations like "3br", "2ba")
     keyword_count = 0
-    for keyword in PROPERTY_KEYWORDS:
-        # For short keywords (1-2 chars), check if they appear as part of property-related patterns
-        if len(keyword) <= 2:
-            # Check for patterns like "3br", "2ba", "$500", etc.
-            if keyword == "$":
-                # Special handling for dollar sign
-                if "$" in text_lower:
-                    keyword_count += 1
-            else:
-                # Check for patterns like "3br", "2ba" (number + abbreviation)
-                pattern = r'\d+' + re.escape(keyword) + r'\b'
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    keyword_count += 1
-        else:
-            # For longer keywords, check if they appear in text (word boundary aware)
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                keyword_count += 1
+    for pattern in _PROPERTY_KEYWORD_RES:
+        if pattern.search(text_lower):
+            keyword_count += 1
+            if keyword_count >= min_keywords:
+                return None
     
     # Additional heuristics: If text looks like an address (contains location terms, commas, etc.)
     # and has some structure, consider it property-related even without explicit keywords
@@ -210,14 +240,9 @@ def validate_property_related(text: str, min_keywords: int = 1) -> Optional[str]
         # - Contains commas (typical of addresses: "street, city, state")
         # - Contains location-related terms (bay, street, avenue, etc.)
         # - Has some structure (multiple words)
-        has_commas = ',' in text
-        has_location_terms = any(term in text_lower for term in [
-            'street', 'st', 'avenue', 'ave', 'road', 'rd', 'boulevard', 'blvd',
-            'drive', 'dr', 'lane', 'ln', 'way', 'court', 'ct', 'place', 'pl',
-            'bay', 'beach', 'park', 'hills', 'valley', 'creek', 'residency',
-            'residence', 'tower', 'building', 'complex', 'villa'
-        ])
-        has_multiple_words = len(text.split()) >= 2
+        has_commas = ',' in text_lower
+        has_location_terms = _ADDRESS_LOCATION_RE.search(text_lower) is not None
+        has_multiple_words = len(text_lower.split()) >= 2
         
         if (has_commas or has_location_terms) and has_multiple_words:
             looks_like_address = True
@@ -264,30 +289,41 @@ def check_input_guardrails(
     if notes_error:
         errors.append(notes_error)
     
+    # Oversized fields are already rejected, so skip the content scans for
+    # them (a huge paste is never run through the regexes)
+    scan_address = bool(address) and not address_error
+    scan_notes = bool(notes) and not notes_error
+    
+    # Lowercase each field once; the injection and property checks share it
+    # (f-string so None becomes "none", as in the combined property text)
+    address_lower = f"{address}".lower() if not address_error else ""
+    notes_lower = f"{notes}".lower() if not notes_error else ""
+    
     # Check for injection attacks in address
-    injection_error = detect_injection_attacks(address)
+    injection_error = _injection_error(address_lower) if scan_address else None
     if injection_error:
         errors.append(f"Address: {injection_error}")
     
     # Check for injection attacks in notes
-    injection_error = detect_injection_attacks(notes)
+    injection_error = _injection_error(notes_lower) if scan_notes else None
     if injection_error:
         errors.append(f"Notes: {injection_error}")
     
     # Check for inappropriate content in address
-    inappropriate_error = detect_inappropriate_content(address)
+    inappropriate_error = detect_inappropriate_content(address) if scan_address else None
     if inappropriate_error:
         errors.append(f"Address: {inappropriate_error}")
     
     # Check for inappropriate content in notes
-    inappropriate_error = detect_inappropriate_content(notes)
+    inappropriate_error = detect_inappropriate_content(notes) if scan_notes else None
     if inappropriate_error:
         errors.append(f"Notes: {inappropriate_error}")
     
-    # Validate property-related content (combine address and notes)
-    if strict_property_validation:
-        combined_text = f"{address} {notes}"
-        property_error = validate_property_related(combined_text, min_keywords=1)
+    # Validate property-related content (combine address and notes); skipped
+    # when either field is oversized since the input is rejected anyway
+    if strict_property_validation and not (address_error or notes_error):
+        combined_lower = f"{address_lower} {notes_lower}"
+        property_error = _property_related_error(combined_lower, min_keywords=1)
         if property_error:
             errors.append(property_error)
     
@@ -318,6 +354,12 @@ PRICE_KEYWORDS_IN_DESCRIPTION = [
     r'\d+\s*/\s*week',  # "500/week"
 ]
 
+# Price patterns joined into one case-insensitive regex, compiled once
+_PRICE_IN_DESCRIPTION_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in PRICE_KEYWORDS_IN_DESCRIPTION),
+    re.IGNORECASE,
+)
+
 
 def validate_output_structure(llm_parsed: Dict[str, Any], original_price: Optional[float] = None) -> Optional[str]:
     """
@@ -409,12 +451,9 @@ def detect_price_in_description(description: str) -> Optional[str]:
     if not description:
         return None
     
-    description_lower = description.lower()
-    
-    # Check for price-related patterns
-    for pattern in PRICE_KEYWORDS_IN_DESCRIPTION:
-        if re.search(pattern, description_lower, re.IGNORECASE):
-            return "Price information should not appear in description (it should only be in price_block)"
+    # Check for price-related patterns (case-insensitive, no lowercased copy)
+    if _PRICE_IN_DESCRIPTION_RE.search(description):
+        return "Price information should not appear in description (it should only be in price_block)"
     
     return None
 
@@ -10,19 +10,47 @@ Observability:
 """
 
 import json
+import re
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
 from langchain_core.output_parsers import StrOutputParser
 from .tracing import trace_llm_call, set_trace_metadata
 
+# Use orjson for LLM output parsing when installed (optional speedup).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except
+# clause covers both decoders.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
+# Content of a ```json ... ``` (or bare ``` ... ```) markdown fence
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Stdlib decoder for raw_decode: parses the first JSON value at an offset and
+# ignores whatever follows it
+_JSON_DECODER = json.JSONDecoder()
+
+# Keys every listing response must contain (tuple keeps error messages ordered)
+_REQUIRED_KEYS = ("title", "description", "price_block")
+_REQUIRED_KEY_SET = frozenset(_REQUIRED_KEYS)
+
+
+@lru_cache(maxsize=8)
 def initialize_llm(model_name: str = "gpt-4o-mini", model_provider: str = "openai", **kwargs):
     """
     Initialize LLM client using LangChain.
     
+    Clients are cached per (model_name, model_provider, kwargs), so repeated
+    node runs reuse one client instead of rebuilding it. Failed
+    initializations are not cached. Use initialize_llm.cache_clear() to drop
+    cached clients (e.g. after changing API keys).
+    
     Args:
         model_name: Name of the model to use (e.g., "gpt-4o-mini", "gpt-4")
         model_provider: Provider name (e.g., "openai", "anthropic")
-        **kwargs: Additional arguments to pass to init_chat_model
+        **kwargs: Additional arguments to pass to init_chat_model (must be hashable)
         
     Returns:
         Initialized LLM instance
@@ -133,23 +161,12 @@ def parse_json_response(response: str) -> Dict[str, Any]:
     
     # Remove markdown code blocks if present
     if cleaned_response.startswith("```"):
-        # Extract content between ```json and ```
-        lines = cleaned_response.split("\n")
-        # Find start and end of code block
-        start_idx = None
-        end_idx = None
-        for i, line in enumerate(lines):
-            if line.strip().startswith("```"):
-                if start_idx is None:
-                    start_idx = i + 1
-                else:
-                    end_idx = i
-                    break
-        if start_idx is not None and end_idx is not None:
-            cleaned_response = "\n".join(lines[start_idx:end_idx])
-        elif start_idx is not None:
-            # No closing ```, take everything after opening
-            cleaned_response = "\n".join(lines[start_idx:])
+        fence_match = _CODE_FENCE_RE.match(cleaned_response)
+        if fence_match:
+            cleaned_response = fence_match.group(1)
+        else:
+            # No closing ```, take everything after the opening line
+            cleaned_response = cleaned_response.partition("\n")[2]
     
     # Try to find JSON object in the response
     # Look for { ... } pattern
@@ -163,19 +180,25 @@ def parse_json_response(response: str) -> Dict[str, Any]:
     
     # Parse JSON
     try:
-        parsed = json.loads(json_str)
+        parsed = _json_loads(json_str)
     except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON from LLM response: {str(e)}")
+        if start_brace == -1:
+            raise ValueError(f"Failed to parse JSON from LLM response: {str(e)}")
+        # Trailing text may contain its own braces (e.g. "{...} see {note}");
+        # decode just the first complete object instead
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(cleaned_response, start_brace)
+        except json.JSONDecodeError:
+            raise ValueError(f"Failed to parse JSON from LLM response: {str(e)}")
     
-    # Validate required keys
-    required_keys = ["title", "description", "price_block"]
-    missing_keys = [key for key in required_keys if key not in parsed]
-    if missing_keys:
+    # Validate required keys (one subset check on the common, complete path)
+    if not _REQUIRED_KEY_SET.issubset(parsed):
+        missing_keys = [key for key in _REQUIRED_KEYS if key not in parsed]
         raise ValueError(f"Missing required keys in LLM response: {missing_keys}")
     
     # Validate that values are strings
     # Note: price_block can be empty if price was not provided
-    for key in required_keys:
+    for key in _REQUIRED_KEYS:
         if not isinstance(parsed[key], str):
             raise ValueError(f"Invalid value for '{key}': must be a string")
         # Only check for non-empty for title and description
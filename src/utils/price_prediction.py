@@ -8,6 +8,15 @@ It uses structured property data to predict market prices for sale or rental pro
 import json
 from typing import Optional, Dict, Any, List
 
+# Use orjson for LLM output parsing when installed (optional speedup), as in
+# llm_client. orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+# existing except clause covers both decoders.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def build_price_prediction_prompt(
     address: str,
@@ -207,7 +216,7 @@ def parse_price_prediction_response(response: str) -> Dict[str, Any]:
     
     # Parse JSON
     try:
-        parsed = json.loads(json_str)
+        parsed = _json_loads(json_str)
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from LLM response: {str(e)}")
     
@@ -6,10 +6,243 @@ The prompts are designed to generate structured JSON output with
 title, description, and price_block fields.
 """
 
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from .region_config import get_region_config, get_currency_symbol, FieldType
 
 
+# ============================================================================
+# Static Instruction Text
+# ============================================================================
+# These blocks never change between calls, so they are joined once here and
+# appended to the prompt as single parts. The final "\n".join in
+# build_listing_generation_prompt produces the same text as appending each
+# line separately.
+
+_INSTRUCTIONS_HEAD = "\n".join([
+    "=== YOUR TASK ===",
+    "Create a compelling, professional property listing that will attract qualified buyers/renters.",
+    "Write with enthusiasm and precision, making the property sound desirable while remaining factual.",
+    "",
+    "=== WRITING STYLE ===",
+    "• Use vivid, descriptive language that paints a picture",
+    "• Write in an active, engaging voice (avoid passive constructions)",
+    "• Use power words: 'spacious', 'stunning', 'pristine', 'luxurious', 'charming', 'modern', 'bright'",
+    "• Create emotional appeal while staying truthful to the facts",
+    "• Vary sentence length for rhythm and readability",
+    "• Use specific details rather than generic statements",
+    "",
+    "=== 1. TITLE (Max 100 characters) ===",
+    "Create a compelling, SEO-optimized title that captures attention.",
+    "",
+    "REQUIRED ELEMENTS:",
+])
+
+_TITLE_REQUIREMENTS_TAIL = "\n".join([
+    "  ✓ Location (use neighborhood if valid, otherwise city/area from address)",
+    "  ✓ Listing type indicator",
+    "",
+    "TITLE EXAMPLES:",
+])
+
+_DESCRIPTION_HEAD = "\n".join([
+    "",
+    "QUALITY CHECK:",
+    "  • Only use valid location names (skip if neighborhood data seems invalid)",
+    "  • Use Title Case for proper nouns",
+    "  • Make it scannable and keyword-rich for search",
+    "",
+    "=== 2. DESCRIPTION (2-4 paragraphs, 150-300 words) ===",
+    "Write engaging, persuasive prose that makes readers want to see this property.",
+    "",
+    "STRUCTURE:",
+    "  PARAGRAPH 1 - Opening Hook:",
+])
+
+_DESCRIPTION_BODY = "\n".join([
+    "    • Mention the location and what makes it special",
+    "    • Set the tone (e.g., 'Discover your perfect home...', 'Welcome to...')",
+    "",
+    "  PARAGRAPH 2 - Property Features:",
+    "    • Describe the interior spaces with vivid detail",
+    "    • Highlight features from the Property Features section",
+    "    • Use sensory language (bright, spacious, airy, cozy, elegant)",
+    "    • Mention layout, natural light, finishes, or unique characteristics",
+    "",
+    "  PARAGRAPH 3 - Location & Lifestyle:",
+    "    • Describe the neighborhood and what makes it desirable",
+    "    • Mention nearby amenities (schools, parks, shopping, transit) - ONLY if valid",
+    "    • Include neighborhood quality info if provided and meaningful",
+    "    • Connect location benefits to lifestyle (e.g., 'perfect for families', 'urban convenience')",
+    "",
+    "  PARAGRAPH 4 - Call to Action (Optional):",
+])
+
+# Call to action + listing-type language (selected by listing_type)
+_RENTAL_GUIDANCE = "\n".join([
+    "    • Emphasize move-in readiness and rental benefits",
+    "    • Create urgency (e.g., 'Don't miss this opportunity')",
+    "",
+    "RENTAL-SPECIFIC LANGUAGE:",
+    "  • Use present tense: 'features', 'offers', 'includes', 'is located'",
+    "  • Emphasize: move-in ready, convenience, lifestyle, flexibility",
+    "  • Phrases: 'perfect rental opportunity', 'ideal for renters', 'available now'",
+    "  • Focus on: what makes it great to live here NOW",
+])
+
+_SALE_GUIDANCE = "\n".join([
+    "    • Emphasize investment potential or long-term value",
+    "    • Create urgency (e.g., 'Schedule your showing today')",
+    "",
+    "SALE-SPECIFIC LANGUAGE:",
+    "  • Emphasize: investment value, equity potential, long-term benefits",
+    "  • Phrases: 'investment opportunity', 'perfect home', 'build equity'",
+    "  • Focus on: what makes it a smart long-term investment",
+    "  • Can mention: neighborhood growth, property value appreciation",
+])
+
+# Per-listing-type instruction templates: the static blocks above with slots
+# for the property specs, filled with a single format_map per prompt (the
+# blocks contain no literal braces; _INSTRUCTIONS_TAIL does, so it is
+# appended separately)
+_SPEC = "{bedrooms}BR/{bathrooms}BA {property_type}"
+
+
+def _instructions_template(title_examples: List[str], guidance: str) -> str:
+    """Join the instruction blocks around the property-spec slots."""
+    return "\n".join([
+        _INSTRUCTIONS_HEAD,
+        f"  ✓ {_SPEC}",
+        "  ✓ {sqft:,} sqft",
+        _TITLE_REQUIREMENTS_TAIL,
+        *title_examples,
+        _DESCRIPTION_HEAD,
+        "    • Start with an attention-grabbing statement about the {property_type}",
+        "    • Include key specs: {bedrooms} bedrooms, {bathrooms} bathrooms, {sqft:,} sqft",
+        _DESCRIPTION_BODY,
+        guidance,
+    ])
+
+
+_RENTAL_INSTRUCTIONS = _instructions_template([
+    f"  • 'Stunning {_SPEC} for Rent - {{sqft:,}} sqft in [Location]'",
+    f"  • 'Modern {_SPEC} Available for Rent - {{sqft:,}} sqft'",
+    f"  • 'Bright & Spacious {_SPEC} for Rent in [Location]'",
+], _RENTAL_GUIDANCE)
+
+_SALE_INSTRUCTIONS = _instructions_template([
+    f"  • 'Beautiful {_SPEC} for Sale - {{sqft:,}} sqft in [Location]'",
+    f"  • 'Charming {_SPEC} - {{sqft:,}} sqft in [Location]'",
+    f"  • 'Stunning {_SPEC} for Sale - {{sqft:,}} sqft'",
+], _SALE_GUIDANCE)
+
+
+_INSTRUCTIONS_TAIL = "\n".join([
+    "",
+    "DESCRIPTION QUALITY CHECK:",
+    "  ✓ Only use valid, meaningful location/amenity data (skip invalid entries)",
+    "  ✓ Be specific and concrete (avoid vague statements)",
+    "  ✓ Create emotional connection while staying factual",
+    "  ✓ Do NOT include price information (price goes in price_block only)",
+    "  ✓ Make it scannable with varied sentence structure",
+    "",
+    "=== 3. PRICE_BLOCK ===",
+    "Price not provided - return empty string: \"\"",
+    "(Price can be added later when posting the listing)",
+    "",
+    "=== CRITICAL RULES ===",
+    "✓ ONLY use information provided in the sections above",
+    "✓ Do NOT invent, fabricate, or assume any details",
+    "✓ If enrichment data (neighborhood, amenities) seems invalid or unclear, omit it",
+    "✓ Focus on property features from notes and valid location data",
+    "✓ Quality over quantity - better to omit unclear info than include garbage text",
+    "✓ Keep content professional and suitable for real estate websites",
+    "",
+    "=== OUTPUT FORMAT ===",
+    "Return ONLY valid JSON (no markdown, no code blocks, no extra text):",
+    "",
+    "{",
+    '  "title": "Your compelling title here",',
+    '  "description": "Your engaging description here (2-4 paragraphs)",',
+    '  "price_block": ""',
+    "}",
+    "",
+    "IMPORTANT: Return ONLY the JSON object. No explanations, no markdown formatting, no code blocks.",
+])
+
+
+# ============================================================================
+# Enrichment Data Filters
+# ============================================================================
+
+# Words that mark a scraped neighborhood name as garbage (substring match)
+_INVALID_NEIGHBORHOOD_WORDS = (
+    "what", "where", "when", "who", "why", "how", "which", "this", "that",
+    "area", "neighborhood", "location", "place",
+)
+
+# Words that mark a scraped amenity name as garbage (substring match)
+_INVALID_AMENITY_WORDS = (
+    "what", "where", "when", "who", "why", "how", "which", "this", "that",
+    "overview", "website", "click", "here", "more", "details", "page",
+)
+
+
+def _is_valid_amenity(item: str) -> bool:
+    """True if an amenity name has no garbage words and is longer than 2 chars."""
+    item_lower = item.lower().strip()
+    return (
+        not any(word in item_lower for word in _INVALID_AMENITY_WORDS)
+        and len(item.strip()) > 2
+    )
+
+
+# ============================================================================
+# Prompt Cache
+# ============================================================================
+# Workflow retries and repeat drafts rebuild the prompt from identical inputs,
+# so rendered prompts are cached per argument set. typed=True keeps 2 and 2.0
+# apart (bedrooms/sqft render differently).
+_PROMPT_CACHE_SIZE = 1024
+
+
+def _freeze_items(mapping: Optional[Dict[str, Any]]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Hashable, order-preserving view of a dict argument (list values become tuples)."""
+    if mapping is None:
+        return None
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in mapping.items()
+    )
+
+
+def _thaw_items(items: Optional[Tuple[Tuple[str, Any], ...]]) -> Optional[Dict[str, Any]]:
+    """Rebuild the dict argument frozen by _freeze_items."""
+    if items is None:
+        return None
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in items
+    }
+
+
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE, typed=True)
+def _build_prompt_cached(
+    address, listing_type, property_type, bedrooms, bathrooms, sqft,
+    notes, normalized_address, normalized_notes, zip_code, neighborhood,
+    landmarks, key_amenities, neighborhood_quality, region,
+) -> str:
+    """Render the prompt from frozen arguments (see build_listing_generation_prompt)."""
+    return _render_listing_prompt(
+        address, listing_type, property_type, bedrooms, bathrooms, sqft,
+        notes, normalized_address, normalized_notes, zip_code, neighborhood,
+        list(landmarks) if landmarks is not None else None,
+        _thaw_items(key_amenities),
+        _thaw_items(neighborhood_quality),
+        region,
+    )
+
+
 def build_listing_generation_prompt(
     address: str,
     listing_type: str,
@@ -52,7 +285,50 @@ def build_listing_generation_prompt(
         
     Returns:
         Complete prompt string for LLM
+    
+    Note:
+        Prompts are cached per argument set (LRU, see _PROMPT_CACHE_SIZE), so
+        the [DEBUG] section logging only appears the first time a given
+        input is rendered. Inputs that cannot be hashed are rendered uncached.
     """
+    args = (
+        address, listing_type, property_type, bedrooms, bathrooms, sqft,
+        notes, normalized_address, normalized_notes, zip_code, neighborhood,
+    )
+    try:
+        frozen = (
+            tuple(landmarks) if landmarks is not None else None,
+            _freeze_items(key_amenities),
+            _freeze_items(neighborhood_quality),
+            region,
+        )
+        hash(args + frozen)
+    except (TypeError, AttributeError):
+        # Unhashable values (e.g. nested dicts) - render without the cache
+        return _render_listing_prompt(
+            *args, landmarks, key_amenities, neighborhood_quality, region
+        )
+    return _build_prompt_cached(*args, *frozen)
+
+
+def _render_listing_prompt(
+    address: str,
+    listing_type: str,
+    property_type: str,
+    bedrooms: int,
+    bathrooms: float,
+    sqft: int,
+    notes: Optional[str],
+    normalized_address: Optional[str],
+    normalized_notes: Optional[str],
+    zip_code: Optional[str],
+    neighborhood: Optional[str],
+    landmarks: Optional[List[str]],
+    key_amenities: Optional[Dict[str, List[str]]],
+    neighborhood_quality: Optional[Dict[str, Optional[str]]],
+    region: Optional[str],
+) -> str:
+    """Build the prompt text (uncached body of build_listing_generation_prompt)."""
     # Use normalized data if available, otherwise fall back to original
     final_address = normalized_address or address
     final_notes = normalized_notes or notes or ""
@@ -97,12 +373,6 @@ def build_listing_generation_prompt(
     location_info = []
     print(f"[DEBUG] Prompt Builder: Checking location data - zip_code: {zip_code} (truthy: {bool(zip_code)}), neighborhood: {neighborhood} (truthy: {bool(neighborhood)})")
     
-    # Invalid words that should never be used as neighborhood names
-    INVALID_NEIGHBORHOOD_WORDS = [
-        "what", "where", "when", "who", "why", "how", "which", "this", "that",
-        "area", "neighborhood", "location", "place"
-    ]
-    
     if zip_code:
         location_info.append(f"ZIP Code: {zip_code}")
     
@@ -110,8 +380,8 @@ def build_listing_generation_prompt(
     if neighborhood:
         neighborhood_lower = neighborhood.lower().strip()
         # Check if neighborhood is invalid
-        if (neighborhood_lower not in INVALID_NEIGHBORHOOD_WORDS and 
-            not any(word in neighborhood_lower for word in INVALID_NEIGHBORHOOD_WORDS) and
+        # (an exact match is also a substring match, so one any() covers both)
+        if (not any(word in neighborhood_lower for word in _INVALID_NEIGHBORHOOD_WORDS) and
             len(neighborhood.strip()) > 3):
             location_info.append(f"Neighborhood: {neighborhood}")
         else:
@@ -129,20 +399,14 @@ def build_listing_generation_prompt(
     print(f"[DEBUG] Prompt Builder: Checking landmarks - value: {landmarks}, type: {type(landmarks)}, truthy: {bool(landmarks)}")
     if landmarks:
         prompt_parts.append("=== NEARBY LANDMARKS ===")
-        for landmark in landmarks:
-            prompt_parts.append(f"- {landmark}")
+        prompt_parts.extend(f"- {landmark}" for landmark in landmarks)
         prompt_parts.append("")
         print(f"[DEBUG] Prompt Builder: ✅ Added NEARBY LANDMARKS section with {len(landmarks)} landmarks")
     else:
         print(f"[DEBUG] Prompt Builder: ❌ Skipped NEARBY LANDMARKS section (no data or empty list)")
     
     # Key Amenities Section
-    # Filter out invalid/garbage amenity names
-    INVALID_AMENITY_WORDS = [
-        "what", "where", "when", "who", "why", "how", "which", "this", "that",
-        "overview", "website", "click", "here", "more", "details", "page"
-    ]
-    
+    # Filter out invalid/garbage amenity names (see _INVALID_AMENITY_WORDS)
     print(f"[DEBUG] Prompt Builder: Checking key_amenities - value: {key_amenities}, type: {type(key_amenities)}, truthy: {bool(key_amenities)}")
     if key_amenities:
         amenities_added = []
@@ -151,21 +415,15 @@ def build_listing_generation_prompt(
             print(f"[DEBUG] Prompt Builder:   - Category '{category}': {items} (length: {len(items) if items else 0}, truthy: {bool(items)})")
             if items:
                 # Filter out invalid amenity names
-                valid_items = []
-                for item in items:
-                    if isinstance(item, str):
-                        item_lower = item.lower().strip()
-                        # Skip invalid items
-                        if (item_lower not in INVALID_AMENITY_WORDS and
-                            not any(word in item_lower for word in INVALID_AMENITY_WORDS) and
-                            len(item.strip()) > 2):
-                            valid_items.append(item)
+                valid_items = [
+                    item for item in items
+                    if isinstance(item, str) and _is_valid_amenity(item)
+                ]
                 
                 if valid_items:
                     category_name = category.capitalize()
                     prompt_parts.append(f"{category_name}:")
-                    for item in valid_items:
-                        prompt_parts.append(f"  - {item}")
+                    prompt_parts.extend(f"  - {item}" for item in valid_items)
                     amenities_added.append(f"{category}({len(valid_items)} items)")
         prompt_parts.append("")
         if amenities_added:
@@ -196,122 +454,16 @@ def build_listing_generation_prompt(
     else:
         print(f"[DEBUG] Prompt Builder: ❌ Skipped NEIGHBORHOOD QUALITY section (no data)")
     
-    # Instructions Section - Rewritten for better quality and clarity
-    prompt_parts.append("=== YOUR TASK ===")
-    prompt_parts.append("Create a compelling, professional property listing that will attract qualified buyers/renters.")
-    prompt_parts.append("Write with enthusiasm and precision, making the property sound desirable while remaining factual.")
-    prompt_parts.append("")
-    
-    prompt_parts.append("=== WRITING STYLE ===")
-    prompt_parts.append("• Use vivid, descriptive language that paints a picture")
-    prompt_parts.append("• Write in an active, engaging voice (avoid passive constructions)")
-    prompt_parts.append("• Use power words: 'spacious', 'stunning', 'pristine', 'luxurious', 'charming', 'modern', 'bright'")
-    prompt_parts.append("• Create emotional appeal while staying truthful to the facts")
-    prompt_parts.append("• Vary sentence length for rhythm and readability")
-    prompt_parts.append("• Use specific details rather than generic statements")
-    prompt_parts.append("")
-    
-    prompt_parts.append("=== 1. TITLE (Max 100 characters) ===")
-    prompt_parts.append("Create a compelling, SEO-optimized title that captures attention.")
-    prompt_parts.append("")
-    prompt_parts.append("REQUIRED ELEMENTS:")
-    prompt_parts.append(f"  ✓ {bedrooms}BR/{bathrooms_display}BA {property_type}")
-    prompt_parts.append(f"  ✓ {sqft:,} sqft")
-    prompt_parts.append("  ✓ Location (use neighborhood if valid, otherwise city/area from address)")
-    prompt_parts.append("  ✓ Listing type indicator")
-    prompt_parts.append("")
-    prompt_parts.append("TITLE EXAMPLES:")
-    if listing_type == "rent":
-        prompt_parts.append(f"  • 'Stunning {bedrooms}BR/{bathrooms_display}BA {property_type} for Rent - {sqft:,} sqft in [Location]'")
-        prompt_parts.append(f"  • 'Modern {bedrooms}BR/{bathrooms_display}BA {property_type} Available for Rent - {sqft:,} sqft'")
-        prompt_parts.append(f"  • 'Bright & Spacious {bedrooms}BR/{bathrooms_display}BA {property_type} for Rent in [Location]'")
-    else:
-        prompt_parts.append(f"  • 'Beautiful {bedrooms}BR/{bathrooms_display}BA {property_type} for Sale - {sqft:,} sqft in [Location]'")
-        prompt_parts.append(f"  • 'Charming {bedrooms}BR/{bathrooms_display}BA {property_type} - {sqft:,} sqft in [Location]'")
-        prompt_parts.append(f"  • 'Stunning {bedrooms}BR/{bathrooms_display}BA {property_type} for Sale - {sqft:,} sqft'")
-    prompt_parts.append("")
-    prompt_parts.append("QUALITY CHECK:")
-    prompt_parts.append("  • Only use valid location names (skip if neighborhood data seems invalid)")
-    prompt_parts.append("  • Use Title Case for proper nouns")
-    prompt_parts.append("  • Make it scannable and keyword-rich for search")
-    prompt_parts.append("")
-    
-    prompt_parts.append("=== 2. DESCRIPTION (2-4 paragraphs, 150-300 words) ===")
-    prompt_parts.append("Write engaging, persuasive prose that makes readers want to see this property.")
-    prompt_parts.append("")
-    prompt_parts.append("STRUCTURE:")
-    prompt_parts.append("  PARAGRAPH 1 - Opening Hook:")
-    prompt_parts.append(f"    • Start with an attention-grabbing statement about the {property_type}")
-    prompt_parts.append(f"    • Include key specs: {bedrooms} bedrooms, {bathrooms_display} bathrooms, {sqft:,} sqft")
-    prompt_parts.append("    • Mention the location and what makes it special")
-    prompt_parts.append("    • Set the tone (e.g., 'Discover your perfect home...', 'Welcome to...')")
-    prompt_parts.append("")
-    prompt_parts.append("  PARAGRAPH 2 - Property Features:")
-    prompt_parts.append("    • Describe the interior spaces with vivid detail")
-    prompt_parts.append("    • Highlight features from the Property Features section")
-    prompt_parts.append("    • Use sensory language (bright, spacious, airy, cozy, elegant)")
-    prompt_parts.append("    • Mention layout, natural light, finishes, or unique characteristics")
-    prompt_parts.append("")
-    prompt_parts.append("  PARAGRAPH 3 - Location & Lifestyle:")
-    prompt_parts.append("    • Describe the neighborhood and what makes it desirable")
-    prompt_parts.append("    • Mention nearby amenities (schools, parks, shopping, transit) - ONLY if valid")
-    prompt_parts.append("    • Include neighborhood quality info if provided and meaningful")
-    prompt_parts.append("    • Connect location benefits to lifestyle (e.g., 'perfect for families', 'urban convenience')")
-    prompt_parts.append("")
-    prompt_parts.append("  PARAGRAPH 4 - Call to Action (Optional):")
-    if listing_type == "rent":
-        prompt_parts.append("    • Emphasize move-in readiness and rental benefits")
-        prompt_parts.append("    • Create urgency (e.g., 'Don't miss this opportunity')")
-    else:
-        prompt_parts.append("    • Emphasize investment potential or long-term value")
-        prompt_parts.append("    • Create urgency (e.g., 'Schedule your showing today')")
-    prompt_parts.append("")
-    
-    if listing_type == "rent":
-        prompt_parts.append("RENTAL-SPECIFIC LANGUAGE:")
-        prompt_parts.append("  • Use present tense: 'features', 'offers', 'includes', 'is located'")
-        prompt_parts.append("  • Emphasize: move-in ready, convenience, lifestyle, flexibility")
-        prompt_parts.append("  • Phrases: 'perfect rental opportunity', 'ideal for renters', 'available now'")
-        prompt_parts.append("  • Focus on: what makes it great to live here NOW")
-    else:
-        prompt_parts.append("SALE-SPECIFIC LANGUAGE:")
-        prompt_parts.append("  • Emphasize: investment value, equity potential, long-term benefits")
-        prompt_parts.append("  • Phrases: 'investment opportunity', 'perfect home', 'build equity'")
-        prompt_parts.append("  • Focus on: what makes it a smart long-term investment")
-        prompt_parts.append("  • Can mention: neighborhood growth, property value appreciation")
-    prompt_parts.append("")
-    
-    prompt_parts.append("DESCRIPTION QUALITY CHECK:")
-    prompt_parts.append("  ✓ Only use valid, meaningful location/amenity data (skip invalid entries)")
-    prompt_parts.append("  ✓ Be specific and concrete (avoid vague statements)")
-    prompt_parts.append("  ✓ Create emotional connection while staying factual")
-    prompt_parts.append("  ✓ Do NOT include price information (price goes in price_block only)")
-    prompt_parts.append("  ✓ Make it scannable with varied sentence structure")
-    prompt_parts.append("")
-    
-    prompt_parts.append("=== 3. PRICE_BLOCK ===")
-    prompt_parts.append("Price not provided - return empty string: \"\"")
-    prompt_parts.append("(Price can be added later when posting the listing)")
-    prompt_parts.append("")
-    
-    prompt_parts.append("=== CRITICAL RULES ===")
-    prompt_parts.append("✓ ONLY use information provided in the sections above")
-    prompt_parts.append("✓ Do NOT invent, fabricate, or assume any details")
-    prompt_parts.append("✓ If enrichment data (neighborhood, amenities) seems invalid or unclear, omit it")
-    prompt_parts.append("✓ Focus on property features from notes and valid location data")
-    prompt_parts.append("✓ Quality over quantity - better to omit unclear info than include garbage text")
-    prompt_parts.append("✓ Keep content professional and suitable for real estate websites")
-    prompt_parts.append("")
-    prompt_parts.append("=== OUTPUT FORMAT ===")
-    prompt_parts.append("Return ONLY valid JSON (no markdown, no code blocks, no extra text):")
-    prompt_parts.append("")
-    prompt_parts.append("{")
-    prompt_parts.append('  "title": "Your compelling title here",')
-    prompt_parts.append('  "description": "Your engaging description here (2-4 paragraphs)",')
-    prompt_parts.append('  "price_block": ""')
-    prompt_parts.append("}")
-    prompt_parts.append("")
-    prompt_parts.append("IMPORTANT: Return ONLY the JSON object. No explanations, no markdown formatting, no code blocks.")
+    # Instructions Section - the static text is a module-level template per
+    # listing type; only the property-spec slots are filled per call
+    instructions = _RENTAL_INSTRUCTIONS if listing_type == "rent" else _SALE_INSTRUCTIONS
+    prompt_parts.append(instructions.format_map({
+        "bedrooms": bedrooms,
+        "bathrooms": bathrooms_display,
+        "property_type": property_type,
+        "sqft": sqft,
+    }))
+    prompt_parts.append(_INSTRUCTIONS_TAIL)
     
     return "\n".join(prompt_parts)
 
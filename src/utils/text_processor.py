@@ -11,6 +11,23 @@ import re
 from typing import Optional
 
 
+# ============================================================================
+# Compiled Patterns
+# ============================================================================
+# Compiled once at import; the normalizers run on every listing input
+
+_LINE_BREAK_RE = re.compile(r'[\r\n]+')
+# Comma or period plus any following spaces (replaced by the mark + one space)
+_PUNCTUATION_SPACING_RE = re.compile(r'([,.])\s*')
+_NUMBER_COMMA_RE = re.compile(r'(\d+),\s+(\d+)')
+
+# str.translate table deleting control characters except tab, newline and
+# carriage return (those are collapsed by the whitespace pass instead)
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)] + [0x7F]
+)
+
+
 # ============================================================================
 # Text Normalization Functions
 # ============================================================================
@@ -32,13 +49,9 @@ def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
     
-    # Replace all whitespace characters (spaces, tabs, newlines) with single space
-    normalized = re.sub(r'\s+', ' ', text)
-    
-    # Trim leading and trailing whitespace
-    normalized = normalized.strip()
-    
-    return normalized
+    # Split on any run of whitespace (spaces, tabs, newlines) and rejoin with
+    # single spaces; split() also drops leading and trailing whitespace
+    return ' '.join(text.split())
 
 
 def normalize_line_breaks(text: str) -> str:
@@ -58,7 +71,7 @@ def normalize_line_breaks(text: str) -> str:
         return ""
     
     # Replace all line break variations with single space
-    normalized = re.sub(r'[\r\n]+', ' ', text)
+    normalized = _LINE_BREAK_RE.sub(' ', text)
     
     return normalized
 
@@ -82,29 +95,23 @@ def normalize_address(address: str) -> str:
     if not address:
         return ""
     
-    # Normalize line breaks first
-    normalized = normalize_line_breaks(address)
-    
-    # Normalize whitespace
-    normalized = normalize_whitespace(normalized)
+    # Normalize line breaks and whitespace in one pass (split() treats
+    # \r and \n as whitespace, so no separate line-break pass is needed)
+    normalized = normalize_whitespace(address)
     
-    # Address-specific: ensure comma spacing is consistent
+    # Address-specific: ensure comma and period spacing is consistent, in a
+    # single pass (exactly one space after each comma/period)
     # "123 Main St,New York" -> "123 Main St, New York"
-    # But don't break numbers like "$500,000" -> use negative lookahead/lookbehind
-    # Match comma followed by optional whitespace, but not if it's part of a number
-    normalized = re.sub(r',(\s*)', r', \1', normalized)  # Add space after comma
-    normalized = re.sub(r',\s+', ', ', normalized)  # Normalize multiple spaces after comma
-    
-    # Address-specific: ensure period spacing (for abbreviations like "St.")
-    # "123 Main St.New York" -> "123 Main St. New York"
-    # But don't break decimals like "123.45" -> use word boundary
-    normalized = re.sub(r'\.(\s*)', r'. \1', normalized)  # Add space after period
-    normalized = re.sub(r'\.\s+', '. ', normalized)  # Normalize multiple spaces after period
-    normalized = re.sub(r'\.\s*$', '.', normalized)  # Don't add space at end
-    
-    # Fix: Remove space that might have been added inside numbers
-    # "$500, 000" -> "$500,000" (comma in number should not have space)
-    normalized = re.sub(r'(\d+),\s+(\d+)', r'\1,\2', normalized)
+    # "123 Main St.New York" -> "123 Main St. New York" (abbreviations like "St.")
+    # A space added after a trailing period is removed by the final trim
+    # Both regex passes only act on commas/periods, so addresses without
+    # either (e.g. "123 Main St") skip them
+    if ',' in normalized or '.' in normalized:
+        normalized = _PUNCTUATION_SPACING_RE.sub(r'\1 ', normalized)
+        
+        # Fix: Remove space that might have been added inside numbers
+        # "$500, 000" -> "$500,000" (comma in number should not have space)
+        normalized = _NUMBER_COMMA_RE.sub(r'\1,\2', normalized)
     
     # Final trim
     normalized = normalized.strip()
@@ -131,25 +138,27 @@ def normalize_notes(notes: str) -> str:
     if not notes:
         return ""
     
-    # Normalize line breaks first
-    normalized = normalize_line_breaks(notes)
-    
-    # Normalize whitespace
-    normalized = normalize_whitespace(normalized)
+    # Normalize line breaks and whitespace in one pass (split() treats
+    # \r and \n as whitespace, so no separate line-break pass is needed)
+    normalized = normalize_whitespace(notes)
     
     # Notes-specific: ensure comma spacing is consistent
     # "2BR/1BA,1000 sqft" -> "2BR/1BA, 1000 sqft"
     # But don't break numbers like "$500,000"
-    normalized = re.sub(r',(\s*)', r', \1', normalized)  # Add space after comma
-    normalized = re.sub(r',\s+', ', ', normalized)  # Normalize multiple spaces after comma
+    # Whitespace is already collapsed to single spaces, so plain replaces
+    # give exactly one space after each comma
+    normalized = normalized.replace(', ', ',').replace(',', ', ')
     
     # Fix: Remove space that might have been added inside numbers
     # "$500, 000" -> "$500,000" (comma in number should not have space)
-    normalized = re.sub(r'(\d+),\s+(\d+)', r'\1,\2', normalized)
+    # (skipped when there is no comma for the regex to match)
+    if ',' in normalized:
+        normalized = _NUMBER_COMMA_RE.sub(r'\1,\2', normalized)
     
     # Notes-specific: ensure slash spacing (for "2BR/1BA" format)
     # "2BR/1BA" should stay as is, but "2BR / 1BA" should become "2BR/1BA"
-    normalized = re.sub(r'\s*/\s*', '/', normalized)
+    # (single spaces only at this point, so plain replaces are enough)
+    normalized = normalized.replace(' / ', '/').replace(' /', '/').replace('/ ', '/')
     
     # Final trim
     normalized = normalized.strip()
@@ -177,7 +186,9 @@ def clean_text(text: str) -> str:
     
     # Remove control characters (except newline, tab, carriage return)
     # Keep common whitespace characters
-    cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    # Every character the table deletes is non-printable, so printable
+    # text skips the translate pass
+    cleaned = text if text.isprintable() else text.translate(_CONTROL_CHARS_TABLE)
     
     # Normalize whitespace
     cleaned = normalize_whitespace(cleaned)
@@ -11,16 +11,93 @@ It tracks:
 - Node execution times
 """
 
+import atexit
+import importlib.util
+import io
+import itertools
+import operator
+import random
+import threading
 import time
 import os
 from typing import Optional, Dict, Any, Callable, Tuple
-from functools import wraps
+from collections import deque
+from contextvars import ContextVar, copy_context
+from functools import lru_cache, partial, wraps
 import uuid
+import warnings
+
+try:
+    from langchain_core.messages import HumanMessage
+except ImportError:  # langchain not installed; trace_llm_call will raise
+    HumanMessage = None
 
 
 # Global tracer instance (initialized in workflow.py)
 _tracer: Optional[Any] = None
-_trace_metadata: Dict[str, Any] = {}
+
+# Per-request trace metadata. A ContextVar keeps concurrent requests (threads or
+# asyncio tasks) from interleaving metadata. clear_trace_metadata() binds a fresh
+# dict in the caller's context; contexts copied from it (e.g. when LangGraph runs
+# a node) share that same dict, so writes made inside nodes stay visible.
+_trace_metadata_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar("_trace_metadata", default=None)
+
+# Guards list-valued metadata appended to from worker threads of one request
+_trace_metadata_lock = threading.Lock()
+
+
+
+def _get_trace_sample_rate() -> float:
+    """
+    Read OPIK_TRACE_SAMPLE_RATE (0.0-1.0) from the environment.
+    
+    Invalid values fall back to 1.0 (trace everything).
+    """
+    try:
+        rate = float(os.getenv("OPIK_TRACE_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+# Fraction of trace_operation calls that are timed (read once at import)
+_SAMPLE_RATE: float = _get_trace_sample_rate()
+
+
+
+def _get_trace_buffer_size() -> int:
+    """
+    Read OPIK_TRACE_BUFFER_SIZE from the environment.
+    
+    0 (the default) or an invalid value disables background dispatch.
+    """
+    try:
+        return max(int(os.getenv("OPIK_TRACE_BUFFER_SIZE", "0")), 0)
+    except ValueError:
+        return 0
+
+
+# Max callback events buffered for background dispatch (read once at import)
+_TRACE_BUFFER_SIZE: int = _get_trace_buffer_size()
+
+# Opik module and OpikTracer class, imported once on first initialize_tracer call
+_opik_mod: Optional[Any] = None
+_OpikTracer: Optional[Any] = None
+
+
+def _load_opik() -> Tuple[Any, Any]:
+    """
+    Import opik and its LangChain integration once and cache them.
+    
+    Raises:
+        ImportError: If opik is not installed
+    """
+    global _opik_mod, _OpikTracer
+    if _opik_mod is None:
+        import opik
+        from opik.integrations.langchain import OpikTracer
+        _opik_mod, _OpikTracer = opik, OpikTracer
+    return _opik_mod, _OpikTracer
 
 
 def get_opik_config() -> Tuple[bool, Optional[str]]:
@@ -67,6 +144,7 @@ def get_opik_config() -> Tuple[bool, Optional[str]]:
     return use_local, url
 
 
+@lru_cache(maxsize=8)
 def _normalize_local_opik_url(url: Optional[str]) -> str:
     """
     Ensure the provided URL points to the Opik REST API root.
@@ -84,6 +162,10 @@ def _normalize_local_opik_url(url: Optional[str]) -> str:
     if not normalized:
         return default_base
     
+    # Already canonical (str.strip returns the same object when nothing is stripped)
+    if normalized.endswith("/api/"):
+        return normalized
+    
     # Guarantee trailing slash
     if not normalized.endswith("/"):
         normalized += "/"
@@ -98,6 +180,205 @@ def _normalize_local_opik_url(url: Optional[str]) -> str:
     return normalized
 
 
+def _configure_opik_cloud(opik: Any) -> None:
+    """
+    Configure Opik for cloud mode.
+    
+    Opik will use COMET_API_KEY from environment if available.
+    Otherwise, it will prompt for API key or use automatic approvals.
+    """
+    try:
+        opik.configure(use_local=False, automatic_approvals=True)
+        api_key_status = "Set" if os.environ.get("COMET_API_KEY") is not None else "Not set - Opik will prompt for API key"
+        print("\n".join([
+            "[TRACE] Opik configured for CLOUD mode",
+            f"[TRACE] COMET_API_KEY: {api_key_status}",
+            "[TRACE] View traces at: https://www.comet.com/opik",
+        ]))
+    except Exception as e:
+        print("\n".join([
+            f"[TRACE] Warning: Could not configure Opik cloud mode: {e}",
+            "[TRACE] Make sure COMET_API_KEY is set in your environment",
+        ]))
+
+
+class _BufferedTracer:
+    """
+    Callback handler wrapper that hands tracer events to a background thread.
+    
+    on_* callbacks are queued and dispatched in order by a daemon flusher
+    thread, so slow trace export never blocks the workflow. Load is shed at
+    admission, per run: when max_events are already queued, a new run's
+    *_start event is dropped and so is every later event for that run and its
+    child runs. Once a run's start is queued, its remaining events (tokens,
+    *_end, *_error) are always queued, so the tracer never sees a half-open or
+    orphaned span. The number of dropped events is recorded in the trace
+    metadata as "dropped_trace_events", and a RuntimeWarning is issued when
+    the first event is dropped. Each event runs in a copy of the context it was
+    queued from. Other attributes are forwarded to the wrapped tracer unchanged.
+    """
+    
+    _BATCH_SIZE = 500
+    _WRAPPER_ATTRS = frozenset({
+        "_tracer", "_max_events", "_events", "_cond", "_dispatch_lock",
+        "_dropped", "_admitted_runs", "_rejected_runs",
+    })
+    
+    def __init__(self, tracer: Any, max_events: int):
+        self._tracer = tracer
+        self._max_events = max_events
+        # Unbounded: admission control on *_start events bounds its growth
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self._dispatch_lock = threading.Lock()
+        self._dropped = 0
+        # run_ids whose *_start was queued / dropped, until their end or error
+        self._admitted_runs: set = set()
+        self._rejected_runs: set = set()
+        threading.Thread(target=self._flush_loop, name="opik-trace-flusher", daemon=True).start()
+        atexit.register(self.flush)
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the wrapper itself
+        if name in self._WRAPPER_ATTRS:
+            raise AttributeError(name)
+        attr = getattr(self._tracer, name)
+        if name.startswith("on_") and callable(attr):
+            return partial(self._enqueue, name)
+        return attr
+    
+    def _admit(self, method_name: str, run_id: Any, parent_run_id: Any) -> bool:
+        """Decide whether to queue an event and track run state (caller holds self._cond)."""
+        if method_name.endswith("_start"):
+            full = len(self._events) >= self._max_events
+            if full or (parent_run_id is not None and parent_run_id in self._rejected_runs):
+                if run_id is not None:
+                    self._rejected_runs.add(run_id)
+                return False
+            if run_id is not None:
+                self._admitted_runs.add(run_id)
+            return True
+        
+        run_finished = method_name.endswith(("_end", "_error"))
+        if run_id in self._admitted_runs:
+            if run_finished:
+                self._admitted_runs.discard(run_id)
+            return True
+        if run_id in self._rejected_runs:
+            if run_finished:
+                self._rejected_runs.discard(run_id)
+            return False
+        # Events not tied to a tracked run are queued while there is room
+        return len(self._events) < self._max_events
+    
+    def _enqueue(self, method_name: str, *args, **kwargs) -> None:
+        """Queue a callback event unless its run was dropped at admission."""
+        run_id = kwargs.get("run_id")
+        parent_run_id = kwargs.get("parent_run_id")
+        dropped = 0
+        with self._cond:
+            if self._admit(method_name, run_id, parent_run_id):
+                self._events.append((copy_context(), method_name, args, kwargs))
+                self._cond.notify()
+            else:
+                self._dropped += 1
+                dropped = self._dropped
+        if dropped:
+            set_trace_metadata("dropped_trace_events", dropped)
+            if dropped == 1:
+                warnings.warn(
+                    f"Trace buffer full ({self._max_events} events); dropping new "
+                    "runs. See the dropped_trace_events trace metadata for the count.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+    
+    def _take_batch(self, limit: int) -> list:
+        """Pop up to limit queued events (caller holds self._cond)."""
+        return [self._events.popleft() for _ in range(min(limit, len(self._events)))]
+    
+    def _dispatch(self, batch: list) -> None:
+        """Deliver events to the wrapped tracer (caller holds self._dispatch_lock)."""
+        for ctx, method_name, args, kwargs in batch:
+            try:
+                ctx.run(getattr(self._tracer, method_name), *args, **kwargs)
+            except Exception as e:
+                print(f"[TRACE] Tracer callback {method_name} failed: {e}")
+    
+    def _flush_loop(self) -> None:
+        """Background loop: wait for events and dispatch them in batches."""
+        while True:
+            with self._cond:
+                while not self._events:
+                    self._cond.wait()
+            with self._dispatch_lock:
+                with self._cond:
+                    batch = self._take_batch(self._BATCH_SIZE)
+                self._dispatch(batch)
+    
+    def flush(self) -> None:
+        """Synchronously dispatch all queued events, then flush the wrapped tracer."""
+        with self._dispatch_lock:
+            with self._cond:
+                batch = self._take_batch(len(self._events))
+            self._dispatch(batch)
+        tracer_flush = getattr(self._tracer, "flush", None)
+        if callable(tracer_flush):
+            tracer_flush()
+
+
+class _LazyOpikTracer:
+    """
+    Callback handler proxy that defers importing opik until first use.
+    
+    LangChain only reads attributes of a callback handler once a traced run
+    starts, so the opik import (and OpikTracer construction) is paid on the
+    first workflow execution instead of at startup. Every attribute lookup is
+    forwarded to the real OpikTracer. If it cannot be created, a no-op
+    callback handler is used so the workflow still runs untraced.
+    """
+    
+    _PROXY_ATTRS = frozenset({"_graph", "_project_name", "_use_local", "_real"})
+    
+    def __init__(self, graph: Any, project_name: str, use_local: bool):
+        self._graph = graph
+        self._project_name = project_name
+        self._use_local = use_local
+        self._real: Optional[Any] = None
+    
+    def _load(self) -> Any:
+        """Import opik and build the real OpikTracer on first call."""
+        if self._real is None:
+            try:
+                opik, OpikTracer = _load_opik()
+                # Only configure for cloud mode (local mode uses environment variable)
+                if not self._use_local:
+                    _configure_opik_cloud(opik)
+                # Note: graph is already the result of compiled_workflow.get_graph(xray=True)
+                # Opik will handle connection errors gracefully - traces will be queued
+                tracer = OpikTracer(
+                    graph=self._graph,
+                    project_name=self._project_name
+                )
+                if _TRACE_BUFFER_SIZE > 0:
+                    tracer = _BufferedTracer(tracer, _TRACE_BUFFER_SIZE)
+                self._real = tracer
+            except Exception as e:
+                from langchain_core.callbacks import BaseCallbackHandler
+                print("\n".join([
+                    f"[WARNING] Failed to initialize Opik tracer: {e}",
+                    "[WARNING] Tracing will be disabled.",
+                ]))
+                self._real = BaseCallbackHandler()
+        return self._real
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the proxy itself
+        if name in self._PROXY_ATTRS:
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+
 def initialize_tracer(
     graph: Any,
     project_name: str = "property-listing-system",
@@ -107,6 +388,9 @@ def initialize_tracer(
     """
     Initialize Opik tracer for LangGraph workflow.
     
+    The opik package is not imported here; the returned handler imports it and
+    creates the real OpikTracer the first time a traced run uses it.
+    
     Args:
         graph: The compiled LangGraph workflow (use graph.get_graph(xray=True))
         project_name: Name of the project for Opik dashboard
@@ -118,7 +402,7 @@ def initialize_tracer(
              so that the API is reachable at the URL provided here.
         
     Returns:
-        OpikTracer instance
+        Lazy OpikTracer callback handler, or None if opik is not installed
     """
     try:
         # For local mode, just set the environment variable - no need to call configure()
@@ -126,55 +410,36 @@ def initialize_tracer(
         if use_local:
             normalized_url = _normalize_local_opik_url(url)
             os.environ["OPIK_URL_OVERRIDE"] = normalized_url
-            print(f"[TRACE] Opik configured for LOCAL mode: api_root={normalized_url}")
-            print(f"[TRACE] ⚠️  Start the Opik local server (see Opik docs) so the API is reachable.")
-            print(f"[TRACE]    Expected health check: {normalized_url}is-alive/ping")
-            print(f"[TRACE]    UI will be served at {normalized_url.replace('/api/', '/')}")
+            ui_url = normalized_url.replace('/api/', '/')
+            print("\n".join([
+                f"[TRACE] Opik configured for LOCAL mode: api_root={normalized_url}",
+                "[TRACE] ⚠️  Start the Opik local server (see Opik docs) so the API is reachable.",
+                f"[TRACE]    Expected health check: {normalized_url}is-alive/ping",
+                f"[TRACE]    UI will be served at {ui_url}",
+            ]))
             url = normalized_url
-        
-        # Import after setting environment variables
-        import opik
-        from opik.integrations.langchain import OpikTracer
-        
-        # Only configure for cloud mode (local mode uses environment variable)
-        if not use_local:
+        elif "OPIK_URL_OVERRIDE" in os.environ:
             # Cloud mode - remove local URL override if it exists
-            if "OPIK_URL_OVERRIDE" in os.environ:
-                del os.environ["OPIK_URL_OVERRIDE"]
-            
-            # Configure Opik for cloud mode
-            # Opik will use COMET_API_KEY from environment if available
-            # Otherwise, it will prompt for API key or use automatic approvals
-            try:
-                opik.configure(use_local=False, automatic_approvals=True)
-                api_key = os.environ.get("COMET_API_KEY", "Not set (will prompt if needed)")
-                print(f"[TRACE] Opik configured for CLOUD mode")
-                print(f"[TRACE] COMET_API_KEY: {'Set' if api_key != 'Not set (will prompt if needed)' else 'Not set - Opik will prompt for API key'}")
-                print(f"[TRACE] View traces at: https://www.comet.com/opik")
-            except Exception as e:
-                print(f"[TRACE] Warning: Could not configure Opik cloud mode: {e}")
-                print(f"[TRACE] Make sure COMET_API_KEY is set in your environment")
+            del os.environ["OPIK_URL_OVERRIDE"]
         
-        # Initialize OpikTracer with the graph
-        # Note: graph is already the result of compiled_workflow.get_graph(xray=True)
-        # Opik will handle connection errors gracefully - traces will be queued
-        tracer = OpikTracer(
-            graph=graph,
-            project_name=project_name
-        )
+        # Check availability without importing opik
+        if _opik_mod is None and importlib.util.find_spec("opik") is None:
+            raise ImportError("opik")
         
         # Note: Connection errors are expected if proxy server isn't running
         # Opik will retry sending traces when the server becomes available
-        return tracer
+        return _LazyOpikTracer(graph, project_name, use_local)
 
     except ImportError:
         print("[WARNING] Opik not installed. Tracing will be disabled.")
         return None
     except Exception as e:
-        print(f"[WARNING] Failed to initialize Opik tracer: {e}")
-        print("[WARNING] Tracing will be disabled.")
-        print("[WARNING] Note: Connection errors are normal if Opik proxy server isn't running.")
-        print("[WARNING] Ensure the Opik local server is running and reachable at the configured URL.")
+        print("\n".join([
+            f"[WARNING] Failed to initialize Opik tracer: {e}",
+            "[WARNING] Tracing will be disabled.",
+            "[WARNING] Note: Connection errors are normal if Opik proxy server isn't running.",
+            "[WARNING] Ensure the Opik local server is running and reachable at the configured URL.",
+        ]))
         return None
 
 
@@ -189,29 +454,71 @@ def get_tracer() -> Optional[Any]:
     return _tracer
 
 
+def _current_trace_metadata() -> Dict[str, Any]:
+    """Return the metadata dict bound to the current context, creating it if needed."""
+    metadata = _trace_metadata_var.get()
+    if metadata is None:
+        metadata = {}
+        _trace_metadata_var.set(metadata)
+    return metadata
+
+
 def set_trace_metadata(key: str, value: Any) -> None:
     """Set metadata for the current trace."""
-    global _trace_metadata
-    _trace_metadata[key] = value
+    _current_trace_metadata()[key] = value
+
+
+def append_trace_metadata(key: str, value: Any) -> None:
+    """Append value to the list stored under key, creating the list if needed."""
+    metadata = _current_trace_metadata()
+    with _trace_metadata_lock:
+        metadata.setdefault(key, []).append(value)
+
+
+def submit_with_trace_context(executor: Any, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Submit fn to executor so it sees the caller's trace metadata.
+    
+    Pool threads start with an empty context, so metadata written there would
+    land in a per-thread dict the caller never reads. The caller's dict is
+    bound first and each task runs in its own copy of the caller's context
+    (a Context cannot be entered by two threads at once), so every worker
+    writes into that same dict.
+    
+    Returns:
+        The Future returned by executor.submit
+    """
+    _current_trace_metadata()
+    return executor.submit(copy_context().run, fn, *args, **kwargs)
 
 
 def get_trace_metadata() -> Dict[str, Any]:
     """Get all trace metadata."""
-    return _trace_metadata.copy()
+    return _current_trace_metadata().copy()
 
 
 def clear_trace_metadata() -> None:
     """Clear trace metadata (call at start of new request)."""
-    global _trace_metadata
-    _trace_metadata = {}
+    _trace_metadata_var.set({})
 
 
 class TimingContext:
     """Context manager for timing operations and tracking metrics."""
     
+    __slots__ = (
+        "operation_name",
+        "metadata",
+        "start_time",
+        "end_time",
+        "duration",
+        "first_token_time",
+        "ttft",
+    )
+    
     def __init__(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None):
         self.operation_name = operation_name
-        self.metadata = metadata or {}
+        # Left as None when not provided to avoid an empty dict per timer
+        self.metadata: Optional[Dict[str, Any]] = metadata
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.duration: Optional[float] = None
@@ -263,6 +570,9 @@ def trace_operation(operation_name: str, metadata: Optional[Dict[str, Any]] = No
     """
     Decorator to trace an operation with timing.
     
+    Only a fraction of calls is timed when OPIK_TRACE_SAMPLE_RATE is below 1.0;
+    unsampled calls run the function directly.
+    
     Usage:
         @trace_operation("web_search", {"query": "..."})
         def my_function():
@@ -271,6 +581,9 @@ def trace_operation(operation_name: str, metadata: Optional[Dict[str, Any]] = No
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if _SAMPLE_RATE < 1.0 and random.random() >= _SAMPLE_RATE:
+                return func(*args, **kwargs)
+            
             op_metadata = metadata or {}
             # Add function name and args info
             op_metadata["function"] = func.__name__
@@ -304,7 +617,11 @@ def trace_llm_call(
     Returns:
         Tuple of (response, metrics_dict)
     """
-    from langchain_core.messages import HumanMessage
+    if HumanMessage is None:
+        raise ImportError(
+            "langchain_core is required for trace_llm_call. "
+            "Install it with: pip install langchain-core"
+        )
     
     metrics = {
         "operation": "llm_call",
@@ -325,20 +642,25 @@ def trace_llm_call(
             # Check if LLM supports streaming
             if hasattr(llm, "stream"):
                 # Use streaming to track TTFT
-                first_token_received = False
-                response_parts = []
+                stream = iter(llm.stream(messages))
+                first_chunk = next(stream, None)
+                buffer = io.StringIO()
                 
-                for chunk in llm.stream(messages):
-                    if not first_token_received:
-                        timer.mark_first_token()
-                        first_token_received = True
+                if first_chunk is not None:
+                    timer.mark_first_token()
+                    
+                    # Pick the content accessor once from the first chunk
+                    # instead of probing every chunk with hasattr/isinstance
+                    if isinstance(first_chunk, str):
+                        get_content = str
+                    else:
+                        get_content = operator.attrgetter("content")
                     
-                    if hasattr(chunk, 'content'):
-                        response_parts.append(chunk.content)
-                    elif isinstance(chunk, str):
-                        response_parts.append(chunk)
+                    buffer.write(get_content(first_chunk))
+                    for chunk in stream:
+                        buffer.write(get_content(chunk))
                 
-                response = "".join(response_parts)
+                response = buffer.getvalue()
             else:
                 # Non-streaming: invoke and track total time
                 response = llm.invoke(messages)
@@ -404,9 +726,10 @@ def trace_web_search(
             
             # Extract URLs for reference
             if results_list:
-                metrics["urls"] = [
-                    r.get("url", "") for r in results_list if isinstance(r, dict)
-                ][:5]  # Limit to 5 URLs
+                metrics["urls"] = list(itertools.islice(
+                    (r.get("url", "") for r in results_list if isinstance(r, dict)),
+                    5,  # Limit to 5 URLs
+                ))
             
             return results_list, metrics
             
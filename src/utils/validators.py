@@ -10,6 +10,7 @@ These validations are separate from guardrail safety checks and focus on:
 """
 
 from typing import Optional, List, Literal
+from math import isfinite
 import re
 
 
@@ -21,8 +22,22 @@ import re
 MIN_PRICE = 0.01  # Minimum valid price (1 cent)
 MAX_PRICE = 999_999_999.99  # Maximum reasonable price
 
+# Address validation
+MIN_ADDRESS_LENGTH = 5  # Minimum characters after stripping
+
 # Listing type validation
 VALID_LISTING_TYPES = ["sale", "rent"]
+# Set form for membership checks (the list above is kept for error messages)
+_VALID_LISTING_TYPE_SET = frozenset(VALID_LISTING_TYPES)
+
+# Matches any letter or digit (same characters as str.isalnum)
+_ALNUM_RE = re.compile(r'[^\W_]')
+
+# Matches any whitespace character (same characters str.split() splits on)
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Accepted numeric types (bool is rejected explicitly despite subclassing int)
+_NUMBER_TYPES = (int, float)
 
 
 # ============================================================================
@@ -56,6 +71,11 @@ def validate_required_field(value: Optional[str], field_name: str) -> Optional[s
 # Listing Type Validation
 # ============================================================================
 
+def _norm_listing_type(listing_type: str) -> str:
+    """Normalize a listing type for comparison (strip first so lower() scans less)."""
+    return listing_type.strip().lower()
+
+
 def validate_listing_type(listing_type: Optional[str]) -> Optional[str]:
     """
     Validate listing type is valid.
@@ -72,9 +92,7 @@ def validate_listing_type(listing_type: Optional[str]) -> Optional[str]:
     if not isinstance(listing_type, str):
         return "listing_type must be a string"
     
-    listing_type_lower = listing_type.lower().strip()
-    
-    if listing_type_lower not in VALID_LISTING_TYPES:
+    if _norm_listing_type(listing_type) not in _VALID_LISTING_TYPE_SET:
         return f"listing_type must be one of {VALID_LISTING_TYPES}, got '{listing_type}'"
     
     return None
@@ -84,6 +102,19 @@ def validate_listing_type(listing_type: Optional[str]) -> Optional[str]:
 # Price Validation
 # ============================================================================
 
+def _is_number(value: object) -> bool:
+    """
+    Check that value is an int or float (but not bool).
+    
+    The exact type check covers the common case; isinstance is only needed for
+    numeric subclasses such as numpy.float64.
+    """
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return True
+    return value_type is not bool and isinstance(value, _NUMBER_TYPES)
+
+
 def validate_price(price: Optional[float], field_name: str = "price", required: bool = True) -> Optional[str]:
     """
     Validate price is a valid positive number.
@@ -101,9 +132,14 @@ def validate_price(price: Optional[float], field_name: str = "price", required:
             return f"{field_name} is required"
         return None  # Price is optional
     
-    if not isinstance(price, (int, float)):
+    if not _is_number(price):
         return f"{field_name} must be a number"
     
+    # NaN compares False against both bounds, so reject non-finite values first
+    # (only floats can be non-finite; isfinite overflows on huge ints)
+    if isinstance(price, float) and not isfinite(price):
+        return f"{field_name} must be a finite number"
+    
     if price < MIN_PRICE:
         return f"{field_name} must be at least ${MIN_PRICE:.2f}"
     
@@ -132,9 +168,12 @@ def validate_non_negative_number(
     if value is None:
         return None  # Field is optional
     
-    if not isinstance(value, (int, float)):
+    if not _is_number(value):
         return f"{field_name} must be a number"
     
+    if isinstance(value, float) and not isfinite(value):
+        return f"{field_name} must be a finite number"
+    
     if value < 0:
         return f"{field_name} cannot be negative"
     
@@ -165,9 +204,9 @@ def validate_address(address: Optional[str]) -> Optional[str]:
     
     Validation checks:
     1. Required field (not empty)
-    2. Minimum length (5 characters)
+    2. Minimum length (MIN_ADDRESS_LENGTH characters)
     3. Contains alphanumeric content
-    4. Has sufficient structure (recommends city/state/location info)
+    4. Has sufficient structure (at least two words)
     
     Args:
         address: Address to validate
@@ -175,70 +214,33 @@ def validate_address(address: Optional[str]) -> Optional[str]:
     Returns:
         Error message if validation fails, None otherwise
     """
-    error = validate_required_field(address, "address")
-    if error:
-        return error
+    # None/non-string values fail the required check
+    if not isinstance(address, str):
+        return validate_required_field(address, "address")
     
-    # Basic format check: address should have some structure
-    address_stripped = address.strip()  # type: ignore
+    # Strip once and reuse it for the required check (address is known to be
+    # a string here, so validate_required_field reduces to the empty check)
+    address_stripped = address.strip()
+    if not address_stripped:
+        return "address cannot be empty"
     
-    if len(address_stripped) < 5:
-        return "address is too short (minimum 5 characters). Please provide a complete address for accurate listing generation."
+    # Basic format check: address should have some structure
+    if len(address_stripped) < MIN_ADDRESS_LENGTH:
+        return f"address is too short (minimum {MIN_ADDRESS_LENGTH} characters). Please provide a complete address for accurate listing generation."
     
     # Additional check: Address should contain at least some alphanumeric content
     # and not be just special characters
-    has_alphanumeric = any(char.isalnum() for char in address_stripped)
-    if not has_alphanumeric:
+    if _ALNUM_RE.search(address_stripped) is None:
         return "address must contain letters or numbers"
     
-    # Enhanced validation: Check for address completeness
-    # Address should ideally contain location information (city, state, country, etc.)
-    # This is crucial for accurate web search and listing generation
-    
-    address_lower = address_stripped.lower()
-    
-    # Check for common address components that indicate completeness
-    # These are indicators that address has sufficient location information
-    has_location_indicators = False
-    
-    # Check for commas (indicates structured address with multiple components)
-    # Examples: "123 Main St, New York, NY" or "Building Name, Area, City"
-    if ',' in address_stripped:
-        has_location_indicators = True
-    
-    # Check for common location keywords (city, state, country indicators)
-    location_keywords = [
-        # US states (common abbreviations and full names)
-        'ny', 'ca', 'tx', 'fl', 'il', 'pa', 'oh', 'ga', 'nc', 'mi',
-        'new york', 'california', 'texas', 'florida', 'illinois',
-        # Common location terms
-        'city', 'state', 'street', 'st', 'avenue', 'ave', 'road', 'rd',
-        'boulevard', 'blvd', 'drive', 'dr', 'lane', 'ln', 'way', 'court', 'ct',
-        # International indicators
-        'district', 'province', 'region', 'country', 'postal', 'zip',
-        # Building/complex indicators (still valid addresses)
-        'tower', 'residency', 'residence', 'building', 'complex', 'apartment', 'apt',
-        'condo', 'condominium', 'villa', 'estate', 'park', 'plaza', 'center', 'centre'
-    ]
-    
-    # Check if address contains location keywords
-    if any(keyword in address_lower for keyword in location_keywords):
-        has_location_indicators = True
-    
-    # Check for ZIP/postal code pattern (5 digits or 5+4 format)
-    zip_pattern = r'\b\d{5}(-\d{4})?\b'
-    if re.search(zip_pattern, address_stripped):
-        has_location_indicators = True
-    
-    # If address doesn't have clear location indicators, it might be incomplete
-    # However, we don't fail validation - we just note it might affect accuracy
-    # Some valid addresses might not match these patterns (e.g., "123 Main St" alone)
-    # The enrichment step will attempt to find more information via web search
+    # Location completeness (city/state/ZIP indicators) is deliberately not
+    # checked here: it never failed validation, and the enrichment step already
+    # attempts to find missing location information via web search.
     
     # Minimum requirement: Address should have at least 2 words (basic structure)
     # This catches cases like "123" or "Main" which are too vague
-    word_count = len(address_stripped.split())
-    if word_count < 2:
+    # (the address is already stripped, so any whitespace separates two words)
+    if _WHITESPACE_RE.search(address_stripped) is None:
         return "address appears incomplete. Please provide a complete address including street name and city/location for accurate listing generation."
     
     # Address validation: Accept addresses with or without street numbers
@@ -275,7 +277,8 @@ def validate_notes(notes: Optional[str]) -> Optional[str]:
         return "notes must be a string"
     
     # Empty string (even with whitespace) is also acceptable for optional field
-    if notes.strip() == "":
+    # (isspace scans without allocating a stripped copy; "".isspace() is False)
+    if not notes or notes.isspace():
         return None  # Notes are optional, empty is acceptable
     
     # Only validate length if notes has actual content
@@ -308,21 +311,17 @@ def validate_rental_fields(
     Returns:
         List of error messages (empty if all valid)
     """
-    errors: List[str] = []
-    
     # Only validate if listing type is rent
-    if listing_type and listing_type.lower().strip() != "rent":
-        return errors  # Not a rental, skip rental-specific validation
+    if listing_type and _norm_listing_type(listing_type) != "rent":
+        return []  # Not a rental, skip rental-specific validation
     
     # Validate security_deposit
     deposit_error = validate_non_negative_number(security_deposit, "security_deposit")
-    if deposit_error:
-        errors.append(deposit_error)
     
     # billing_cycle and lease_term are optional strings - no validation needed
     # They're just informational fields
     
-    return errors
+    return [deposit_error] if deposit_error else []
 
 
 # ============================================================================
@@ -354,38 +353,23 @@ def validate_sale_fields(
     Returns:
         List of error messages (empty if all valid)
     """
-    errors: List[str] = []
-    
     # Only validate if listing type is sale
-    if listing_type and listing_type.lower().strip() != "sale":
-        return errors  # Not a sale, skip sale-specific validation
-    
-    # Validate hoa_fees (US/CA/UK)
-    hoa_error = validate_non_negative_number(hoa_fees, "hoa_fees")
-    if hoa_error:
-        errors.append(hoa_error)
-    
-    # Validate property_taxes (US/CA)
-    taxes_error = validate_non_negative_number(property_taxes, "property_taxes")
-    if taxes_error:
-        errors.append(taxes_error)
-    
-    # Validate council_tax (UK)
-    council_tax_error = validate_non_negative_number(council_tax, "council_tax")
-    if council_tax_error:
-        errors.append(council_tax_error)
-    
-    # Validate rates (Australia)
-    rates_error = validate_non_negative_number(rates, "rates")
-    if rates_error:
-        errors.append(rates_error)
-    
-    # Validate strata_fees (Australia/Canada)
-    strata_error = validate_non_negative_number(strata_fees, "strata_fees")
-    if strata_error:
-        errors.append(strata_error)
-    
-    return errors
+    if listing_type and _norm_listing_type(listing_type) != "sale":
+        return []  # Not a sale, skip sale-specific validation
+    
+    # Region-dependent fee/tax fields: hoa_fees (US/CA/UK), property_taxes (US/CA),
+    # council_tax (UK), rates (Australia), strata_fees (Australia/Canada)
+    fields = (
+        ("hoa_fees", hoa_fees),
+        ("property_taxes", property_taxes),
+        ("council_tax", council_tax),
+        ("rates", rates),
+        ("strata_fees", strata_fees),
+    )
+    return [
+        error for field_name, value in fields
+        if (error := validate_non_negative_number(value, field_name))
+    ]
 
 
 # ============================================================================
@@ -430,7 +414,7 @@ def validate_bedrooms(bedrooms: Optional[int]) -> Optional[str]:
     if bedrooms is None:
         return "bedrooms is required"
     
-    if not isinstance(bedrooms, (int, float)):
+    if not _is_number(bedrooms):
         return "bedrooms must be a number"
     
     bedrooms_int = int(bedrooms)
@@ -453,7 +437,7 @@ def validate_bathrooms(bathrooms: Optional[float]) -> Optional[str]:
     if bathrooms is None:
         return "bathrooms is required"
     
-    if not isinstance(bathrooms, (int, float)):
+    if not _is_number(bathrooms):
         return "bathrooms must be a number"
     
     if bathrooms < 0:
@@ -475,7 +459,7 @@ def validate_sqft(sqft: Optional[int]) -> Optional[str]:
     if sqft is None:
         return "sqft is required"
     
-    if not isinstance(sqft, (int, float)):
+    if not _is_number(sqft):
         return "sqft must be a number"
     
     sqft_int = int(sqft)
@@ -512,37 +496,16 @@ def validate_input_fields(
     Returns:
         List of error messages (empty if all validations pass)
     """
-    errors: List[str] = []
-    
-    # Validate required fields
-    address_error = validate_address(address)
-    if address_error:
-        errors.append(address_error)
-    
-    listing_type_error = validate_listing_type(listing_type)
-    if listing_type_error:
-        errors.append(listing_type_error)
-    
-    property_type_error = validate_property_type(property_type)
-    if property_type_error:
-        errors.append(property_type_error)
-    
-    bedrooms_error = validate_bedrooms(bedrooms)
-    if bedrooms_error:
-        errors.append(bedrooms_error)
-    
-    bathrooms_error = validate_bathrooms(bathrooms)
-    if bathrooms_error:
-        errors.append(bathrooms_error)
-    
-    sqft_error = validate_sqft(sqft)
-    if sqft_error:
-        errors.append(sqft_error)
-    
-    # Validate optional fields
-    notes_error = validate_notes(notes)
-    if notes_error:
-        errors.append(notes_error)
-    
-    return errors
+    checks = (
+        # Required fields
+        validate_address(address),
+        validate_listing_type(listing_type),
+        validate_property_type(property_type),
+        validate_bedrooms(bedrooms),
+        validate_bathrooms(bathrooms),
+        validate_sqft(sqft),
+        # Optional fields
+        validate_notes(notes),
+    )
+    return [error for error in checks if error]
 
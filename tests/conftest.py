@@ -0,0 +1,165 @@
+"""
+Shared pytest configuration and fixtures.
+
+``src`` is put on ``sys.path`` by the ``pythonpath`` setting in
+``pytest.ini`` so test modules can import ``core``/``utils``/``models``
+directly.
+
+Canned data that the enrichment and content generation tests previously
+rebuilt inside every test method is built once per module here. Mock objects
+are built per test so call counts never leak between tests.
+State templates are read-only; tests take a copy with
+``{**template, "errors": []}`` before handing it to a node, since nodes
+mutate the state they receive.
+
+The compiled workflow is built once per session and shared, since invoking
+it does not modify the graph.
+
+Data model tests share read-only keyword templates the same way and build
+each case with ``dict(template, field=value)``.
+"""
+
+import pytest
+from types import MappingProxyType
+from unittest.mock import Mock
+
+
+# ============================================================================
+# Mock Tools
+# ============================================================================
+
+@pytest.fixture
+def mock_tavily_tool():
+    """Fresh stand-in for a TavilySearch instance (call history is per test)"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_llm_instance():
+    """Fresh stand-in for an initialized LLM client (call history is per test)"""
+    return Mock()
+
+
+# ============================================================================
+# Workflow
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def workflow():
+    """Compiled workflow graph, built once (invoking it does not modify the graph)"""
+    from core import create_workflow
+    return create_workflow()
+
+
+# ============================================================================
+# State Templates
+# ============================================================================
+
+# Base sale listing shared by make_state (never handed to a node directly)
+_BASE_STATE = MappingProxyType({
+    "address": "123 Main St",
+    "listing_type": "sale",
+    "price": 500000.0,
+})
+
+
+@pytest.fixture(scope="session")
+def make_state():
+    """Factory returning a fresh state: the base sale listing plus overrides"""
+    def _make_state(**overrides):
+        # New errors list on every call so tests never share one
+        return {**_BASE_STATE, "errors": [], **overrides}
+    return _make_state
+
+
+@pytest.fixture(scope="session")
+def base_sale_state():
+    """Minimal sale listing state with a normalized address (no errors list)"""
+    return MappingProxyType({
+        "address": "123 Main St, New York, NY",
+        "listing_type": "sale",
+        "normalized_address": "123 Main St, New York, NY",
+    })
+
+
+@pytest.fixture(scope="session")
+def enriched_state():
+    """Rental listing state carrying normalized text and enrichment data"""
+    return MappingProxyType({
+        "address": "123 Main St",
+        "listing_type": "rent",
+        "price": 2500.0,
+        "notes": "2BR apartment",
+        "normalized_address": "123 Main St, New York, NY",
+        "normalized_notes": "2BR/1BA apartment",
+        "zip_code": "10001",
+        "neighborhood": "Midtown",
+        "landmarks": ["Central Park"],
+        "key_amenities": {"schools": ["PS 123"]},
+        "billing_cycle": "monthly",
+        "security_deposit": 2500.0,
+    })
+
+
+# ============================================================================
+# Model Keyword Templates
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def listing_input_kwargs():
+    """Valid PropertyListingInput kwargs; tests copy with dict(template, **changes)"""
+    return MappingProxyType({
+        "address": "123 Test St",
+        "listing_type": "sale",
+        "price": 100000.0,
+        "notes": "Test",
+    })
+
+
+@pytest.fixture(scope="session")
+def listing_output_kwargs():
+    """Valid ListingOutput kwargs; tests copy with dict(template, **changes)"""
+    return MappingProxyType({
+        "title": "Test Title",
+        "description": "Test description",
+        "price_block": "$100,000",
+    })
+
+
+# ============================================================================
+# Canned Enrichment / LLM Results
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def full_enrichment_result():
+    """Enrichment result with every field populated"""
+    return MappingProxyType({
+        "zip_code": "10001",
+        "neighborhood": "Midtown Manhattan",
+        "landmarks": ["Central Park", "Times Square"],
+        "key_amenities": {
+            "schools": ["PS 123"],
+            "parks": ["Central Park"],
+            "shopping": ["Macy's"],
+            "transportation": ["Subway: 1, 2, 3"]
+        }
+    })
+
+
+@pytest.fixture(scope="module")
+def partial_enrichment_result():
+    """Enrichment result where only the ZIP code was found"""
+    return MappingProxyType({
+        "zip_code": "10001",
+        "neighborhood": None,
+        "landmarks": [],
+        "key_amenities": {}
+    })
+
+
+@pytest.fixture(scope="module")
+def llm_test_output():
+    """Canned raw LLM output and its parsed form as a (raw, parsed) pair"""
+    raw = '{"title": "Test", "description": "Test", "price_block": "$500"}'
+    parsed = MappingProxyType({"title": "Test", "description": "Test", "price_block": "$500"})
+    return raw, parsed
@@ -9,25 +9,71 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
+import re
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from utils.enrichment import (
-    build_neighborhood_search_query,
     build_landmarks_search_query,
     build_amenities_search_query,
+    build_neighborhood_quality_search_query,
     extract_zip_code,
     extract_neighborhood,
     extract_landmarks,
     extract_amenities,
     enrich_property_data,
+    clear_enrichment_cache,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+# Canned Tavily responses keyed by query pattern (first match wins)
+# TavilySearch returns dict with "results" key
+_CANNED_RESPONSES = (
+    (re.compile(r"neighborhood|zip code", re.IGNORECASE), {
+        "results": [
+            {"content": "Located in Midtown Manhattan, ZIP code 10001", "title": "Location Info"}
+        ]
+    }),
+    (re.compile(r"landmarks|attractions", re.IGNORECASE), {
+        "results": [
+            {"content": "Nearby landmarks include Central Park and Times Square", "title": "Attractions"}
+        ]
+    }),
+    (re.compile(r"school", re.IGNORECASE), {
+        "results": [
+            {"content": "Nearby schools include PS 123", "title": "Schools"}
+        ]
+    }),
 )
 
 
+def _canned_invoke(query_dict):
+    """Return the canned response for the first pattern matching the query"""
+    query = query_dict.get("query", "")
+    for pattern, response in _CANNED_RESPONSES:
+        if pattern.search(query):
+            return response
+    return {"results": []}
+
+
+@pytest.fixture(autouse=True)
+def _empty_enrichment_cache():
+    """Start and finish every test with an empty enrichment cache"""
+    clear_enrichment_cache()
+    yield
+    clear_enrichment_cache()
+
+
+@pytest.fixture(scope="module")
+def canned_tavily_tool():
+    """Stand-in Tavily search tool that answers from _CANNED_RESPONSES"""
+    return SimpleNamespace(invoke=_canned_invoke)
+
+
 # ============================================================================
 # Search Query Construction Tests
 # ============================================================================
@@ -35,89 +81,60 @@ from utils.enrichment import (
 class TestSearchQueryConstruction:
     """Test search query construction"""
     
-    def test_build_neighborhood_search_query(self):
-        """Test neighborhood search query construction"""
-        address = "123 Main St, New York, NY"
-        query = build_neighborhood_search_query(address)
-        
-        assert address in query
-        assert "neighborhood" in query.lower()
-        assert "zip code" in query.lower() or "location" in query.lower()
-    
-    def test_build_neighborhood_search_query_with_notes(self):
-        """Test neighborhood search query with notes context"""
-        address = "123 Main St, New York, NY"
-        notes = "Beautiful apartment near downtown"
-        query = build_neighborhood_search_query(address, notes=notes)
-        
-        assert address in query
-        assert "neighborhood" in query.lower()
-    
-    def test_build_landmarks_search_query(self):
-        """Test landmarks search query construction"""
-        address = "123 Main St, New York, NY"
-        query = build_landmarks_search_query(address)
-        
-        assert address in query
-        assert "landmarks" in query.lower() or "attractions" in query.lower()
-    
-    def test_build_landmarks_search_query_with_notes(self):
-        """Test landmarks search query with notes mentioning landmarks"""
-        address = "123 Main St, New York, NY"
-        notes = "Close to Central Park and museums"
-        query = build_landmarks_search_query(address, notes=notes)
-        
-        assert address in query
-        assert ("park" in query.lower() or "museum" in query.lower() or 
-                "landmarks" in query.lower() or "attractions" in query.lower())
+    ADDRESS = "123 Main St, New York, NY"
     
-    def test_build_amenities_search_query_schools(self):
-        """Test amenities search query for schools"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "schools")
-        
-        assert address in query
-        assert "school" in query.lower()
+    @pytest.mark.parametrize("notes,expected_any", [
+        (None, ("landmarks", "attractions")),
+        ("Close to Central Park and museums", ("park", "museum", "landmarks", "attractions")),
+    ])
+    def test_build_landmarks_search_query(self, notes, expected_any):
+        """Test landmarks search query construction (with and without notes)"""
+        if notes is None:
+            query = build_landmarks_search_query(self.ADDRESS)
+        else:
+            query = build_landmarks_search_query(self.ADDRESS, notes=notes)
+        query_lower = query.lower()
+        
+        assert self.ADDRESS in query
+        assert any(keyword in query_lower for keyword in expected_any)
     
-    def test_build_amenities_search_query_schools_with_listing_type(self):
-        """Test amenities search query for schools with sale listing"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "schools", listing_type="sale")
-        
-        assert address in query
-        assert "school" in query.lower()
-    
-    def test_build_amenities_search_query_parks(self):
-        """Test amenities search query for parks"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "parks")
-        
-        assert address in query
-        assert "park" in query.lower()
-    
-    def test_build_amenities_search_query_shopping(self):
-        """Test amenities search query for shopping"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "shopping")
-        
-        assert address in query
-        assert "shopping" in query.lower()
+    @pytest.mark.parametrize("keyword", [
+        "schools",
+        "shopping",
+        "supermarkets",
+        "parks",
+        "subway",
+        "transportation",
+    ])
+    def test_build_amenities_search_query(self, keyword):
+        """Test amenities search query covers each amenity in one address-only query"""
+        query = build_amenities_search_query(self.ADDRESS)
+        
+        assert query.startswith(self.ADDRESS)
+        assert keyword in query.lower()
+
+
+class TestSearchQueryCaching:
+    """Test memoization of the search query builders"""
     
-    def test_build_amenities_search_query_transportation(self):
-        """Test amenities search query for transportation"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "transportation")
-        
-        assert address in query
-        assert "transportation" in query.lower() or "subway" in query.lower()
+    def test_repeat_query_is_cache_hit(self):
+        """Test that building the same query twice hits the cache"""
+        address = "456 Cache Ave, Boston, MA"
+        build_amenities_search_query.cache_clear()
+        first = build_amenities_search_query(address)
+        second = build_amenities_search_query(address)
+        
+        assert first == second
+        assert build_amenities_search_query.cache_info().hits >= 1
     
-    def test_build_amenities_search_query_transportation_rental(self):
-        """Test amenities search query for transportation with rental listing"""
-        address = "123 Main St, New York, NY"
-        query = build_amenities_search_query(address, "transportation", listing_type="rent")
-        
-        assert address in query
-        assert "transportation" in query.lower() or "transit" in query.lower()
+    def test_neighborhood_quality_query_is_cached(self):
+        """Test that the neighborhood quality query builder is memoized"""
+        address = "456 Cache Ave, Boston, MA"
+        build_neighborhood_quality_search_query.cache_clear()
+        build_neighborhood_quality_search_query(address)
+        build_neighborhood_quality_search_query(address)
+        
+        assert build_neighborhood_quality_search_query.cache_info().hits >= 1
 
 
 # ============================================================================
@@ -200,8 +217,8 @@ class TestResultExtraction:
             {"content": "Nearby schools include PS 123 and High School XYZ", "title": "Schools"}
         ]
         
-        schools = extract_amenities(search_results, "schools", max_items=3)
-        assert isinstance(schools, list)
+        amenities = extract_amenities(search_results, max_items=3)
+        assert isinstance(amenities["schools"], list)
         # May or may not extract - both are acceptable
     
     def test_extract_amenities_parks(self):
@@ -210,15 +227,15 @@ class TestResultExtraction:
             {"content": "Nearby parks include Central Park and Riverside Park", "title": "Parks"}
         ]
         
-        parks = extract_amenities(search_results, "parks", max_items=3)
-        assert isinstance(parks, list)
+        amenities = extract_amenities(search_results, max_items=3)
+        assert isinstance(amenities["parks"], list)
     
     def test_extract_amenities_empty_results(self):
         """Test amenities extraction with empty results"""
         search_results = []
         
-        amenities = extract_amenities(search_results, "schools", max_items=3)
-        assert amenities == []
+        amenities = extract_amenities(search_results, max_items=3)
+        assert all(items == [] for items in amenities.values())
 
 
 # ============================================================================
@@ -228,94 +245,56 @@ class TestResultExtraction:
 class TestComprehensiveEnrichment:
     """Test comprehensive enrichment function"""
     
-    def test_enrich_property_data_with_mock_tool(self):
+    def test_enrich_property_data_with_mock_tool(self, canned_tavily_tool):
         """Test enrichment with mocked Tavily tool"""
-        # Mock Tavily search tool
-        mock_tool = Mock()
-        
-        # Mock search results for different queries
-        # TavilySearch returns dict with "results" key
-        def mock_invoke(query_dict):
-            query = query_dict.get("query", "")
-            if "neighborhood" in query.lower() or "zip code" in query.lower():
-                return {
-                    "results": [
-                        {"content": "Located in Midtown Manhattan, ZIP code 10001", "title": "Location Info"}
-                    ]
-                }
-            elif "landmarks" in query.lower() or "attractions" in query.lower():
-                return {
-                    "results": [
-                        {"content": "Nearby landmarks include Central Park and Times Square", "title": "Attractions"}
-                    ]
-                }
-            elif "school" in query.lower():
-                return {
-                    "results": [
-                        {"content": "Nearby schools include PS 123", "title": "Schools"}
-                    ]
-                }
-            else:
-                return {"results": []}
-        
-        mock_tool.invoke = mock_invoke
+        mock_tool = canned_tavily_tool
         
         address = "123 Main St, New York, NY"
         enrichment_data = enrich_property_data(
             address=address,
-            notes="",
-            listing_type="sale",
-            price=None,
             search_tool=mock_tool
         )
         
         assert isinstance(enrichment_data, dict)
         assert "zip_code" in enrichment_data
         assert "neighborhood" in enrichment_data
-        assert "landmarks" in enrichment_data
+        assert "neighborhood_quality" in enrichment_data
         assert "key_amenities" in enrichment_data
         assert isinstance(enrichment_data["key_amenities"], dict)
     
-    def test_enrich_property_data_with_notes_context(self):
-        """Test enrichment uses notes context for better queries"""
-        mock_tool = Mock()
-        mock_tool.invoke = Mock(return_value={"results": []})
-        
-        address = "123 Main St, New York, NY"
-        notes = "Beautiful apartment near Central Park"
-        listing_type = "rent"
-        
-        enrichment_data = enrich_property_data(
-            address=address,
-            notes=notes,
-            listing_type=listing_type,
-            price=None,
-            search_tool=mock_tool
-        )
-        
-        # Verify function was called (even if results are empty)
-        assert mock_tool.invoke.called
-        assert isinstance(enrichment_data, dict)
-    
     def test_enrich_property_data_handles_errors(self):
         """Test that enrichment handles errors gracefully"""
-        # Mock tool that raises exception
-        mock_tool = Mock()
-        mock_tool.invoke = Mock(side_effect=Exception("API Error"))
+        # Stand-in tool that raises exception (no call tracking needed)
+        def _raise(*_):
+            raise Exception("API Error")
+        mock_tool = SimpleNamespace(invoke=_raise)
         
         address = "123 Main St, New York, NY"
         enrichment_data = enrich_property_data(
             address=address,
-            notes="",
-            listing_type=None,
-            price=None,
             search_tool=mock_tool
         )
         
         # Should return empty enrichment data structure
         assert isinstance(enrichment_data, dict)
         assert enrichment_data["zip_code"] is None
-        assert enrichment_data["landmarks"] == []
+        assert all(items == [] for items in enrichment_data["key_amenities"].values())
+    
+    def test_enrich_property_data_caches_repeat_address(self):
+        """Test that a repeated address is served from cache without new searches"""
+        mock_tool = Mock()
+        mock_tool.invoke = Mock(return_value={
+            "results": [{"content": "Crime rate: low. Lincoln High School", "title": "Area"}]
+        })
+        
+        address = "123 Main St, New York, NY 10001"
+        first = enrich_property_data(address=address, search_tool=mock_tool)
+        calls_after_first = mock_tool.invoke.call_count
+        second = enrich_property_data(address=address, search_tool=mock_tool)
+        
+        assert mock_tool.invoke.call_count == calls_after_first
+        assert second == first
+        assert second is not first  # callers get their own copy
     
     def test_enrich_property_data_empty_address(self):
         """Test enrichment with empty address"""
@@ -324,14 +303,13 @@ class TestComprehensiveEnrichment:
         
         enrichment_data = enrich_property_data(
             address="",
-            notes="",
-            listing_type=None,
-            price=None,
             search_tool=mock_tool
         )
         
         assert isinstance(enrichment_data, dict)
         assert enrichment_data["zip_code"] is None
+        # Empty address short-circuits before any web search
+        assert mock_tool.invoke.call_count == 0
 
 
 # ============================================================================
@@ -344,7 +322,7 @@ class TestEnrichmentEdgeCases:
     def test_query_construction_with_special_characters(self):
         """Test query construction with special characters"""
         address = "123 Main St. #4B, New York, NY"
-        query = build_neighborhood_search_query(address)
+        query = build_neighborhood_quality_search_query(address)
         
         assert address in query
     
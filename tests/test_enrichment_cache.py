@@ -0,0 +1,104 @@
+"""
+Unit tests for the enrich_property_data result cache.
+
+Tests cover:
+- Repeat addresses served from cache
+- Partial or failed searches not cached
+- Cache expiry
+- Cache keyed on search tool type
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import utils.enrichment as enrichment
+from utils.enrichment import enrich_property_data, clear_enrichment_cache
+
+
+ADDRESS = "123 Main St, New York, NY 10001"
+
+# Search response with results for both enrichment searches
+_RESULTS = {"results": [{"content": "Crime rate: low. Lincoln High School", "title": "Area"}]}
+
+
+def _fail_quality_search(query_dict):
+    """Answer the amenities search but fail the neighborhood quality search"""
+    if "crime" in query_dict.get("query", "").lower():
+        raise Exception("API Error")
+    return _RESULTS
+
+
+@pytest.fixture(autouse=True)
+def _empty_enrichment_cache():
+    """Start and finish every test with an empty enrichment cache"""
+    clear_enrichment_cache()
+    yield
+    clear_enrichment_cache()
+
+
+# ============================================================================
+# Caching Tests
+# ============================================================================
+
+class TestEnrichmentCache:
+    """Test which enrichment results are cached and for how long"""
+    
+    def test_complete_result_cached(self):
+        """Test that a result where both searches succeeded is served from cache"""
+        tool = Mock()
+        tool.invoke = Mock(return_value=_RESULTS)
+        
+        first = enrich_property_data(address=ADDRESS, search_tool=tool)
+        second = enrich_property_data(address=ADDRESS, search_tool=tool)
+        
+        assert tool.invoke.call_count == 2  # one call per search, first time only
+        assert second == first
+    
+    def test_partial_failure_not_cached(self):
+        """Test that a result with one failed search is searched again next time"""
+        tool = Mock()
+        tool.invoke = Mock(side_effect=_fail_quality_search)
+        
+        enrich_property_data(address=ADDRESS, search_tool=tool)
+        enrich_property_data(address=ADDRESS, search_tool=tool)
+        
+        assert tool.invoke.call_count == 4
+    
+    def test_recovered_search_replaces_partial_result(self):
+        """Test that once the failed search recovers, the full result is returned"""
+        tool = Mock()
+        tool.invoke = Mock(side_effect=_fail_quality_search)
+        partial = enrich_property_data(address=ADDRESS, search_tool=tool)
+        
+        tool.invoke.side_effect = None
+        tool.invoke.return_value = _RESULTS
+        full = enrich_property_data(address=ADDRESS, search_tool=tool)
+        
+        assert partial["neighborhood_quality"]["crime_info"] is None
+        assert full["neighborhood_quality"]["crime_info"] is not None
+    
+    def test_expired_entry_searched_again(self):
+        """Test that a cached result is not served after the TTL"""
+        tool = Mock()
+        tool.invoke = Mock(return_value=_RESULTS)
+        
+        with patch.object(enrichment.time, "monotonic", return_value=1000.0):
+            enrich_property_data(address=ADDRESS, search_tool=tool)
+        later = 1000.0 + enrichment._ENRICHMENT_CACHE_TTL + 1
+        with patch.object(enrichment.time, "monotonic", return_value=later):
+            enrich_property_data(address=ADDRESS, search_tool=tool)
+        
+        assert tool.invoke.call_count == 4
+    
+    def test_different_tool_type_not_served_cached_result(self):
+        """Test that a result cached for one search tool type is not served to another"""
+        tool = Mock()
+        tool.invoke = Mock(return_value=_RESULTS)
+        other_calls = []
+        other_tool = SimpleNamespace(invoke=lambda query_dict: other_calls.append(query_dict) or _RESULTS)
+        
+        enrich_property_data(address=ADDRESS, search_tool=tool)
+        enrich_property_data(address=ADDRESS, search_tool=other_tool)
+        
+        assert len(other_calls) == 2
@@ -11,11 +11,6 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.guardrails import (
     validate_text_length,
@@ -88,55 +83,22 @@ class TestInjectionAttackDetection:
         error = detect_injection_attacks(text)
         assert error is None
     
-    def test_sql_injection_union_select(self):
-        """Test SQL injection with UNION SELECT"""
-        text = "123 Main St' UNION SELECT * FROM users--"
+    @pytest.mark.parametrize("text", [
+        "123 Main St' UNION SELECT * FROM users--",  # SQL: UNION SELECT
+        "123 Main St; DROP TABLE listings;--",  # SQL: DROP TABLE
+        "123 Main St' OR 1=1--",  # SQL: OR 1=1
+        "123 Main St<script>alert('xss')</script>",  # Script: <script> tag
+        "123 Main St javascript:alert('xss')",  # Script: javascript:
+        "123 Main St | cat /etc/passwd",  # Command: pipe
+        "123 Main St && rm -rf /",  # Command: &&
+        "123 Main St UNION SELECT * FROM users",  # Case-insensitive match
+    ])
+    def test_injection_detected(self, text):
+        """Test that SQL, script and command injection payloads are detected"""
         error = detect_injection_attacks(text)
         assert error is not None
         assert "injection attack" in error.lower()
     
-    def test_sql_injection_drop_table(self):
-        """Test SQL injection with DROP TABLE"""
-        text = "123 Main St; DROP TABLE listings;--"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_sql_injection_or_1_equals_1(self):
-        """Test SQL injection with OR 1=1"""
-        text = "123 Main St' OR 1=1--"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_script_injection_script_tag(self):
-        """Test script injection with <script> tag"""
-        text = "123 Main St<script>alert('xss')</script>"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_script_injection_javascript(self):
-        """Test script injection with javascript:"""
-        text = "123 Main St javascript:alert('xss')"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_command_injection_pipe(self):
-        """Test command injection with pipe"""
-        text = "123 Main St | cat /etc/passwd"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_command_injection_ampersand(self):
-        """Test command injection with &&"""
-        text = "123 Main St && rm -rf /"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
-    def test_case_insensitive_detection(self):
-        """Test that injection detection is case-insensitive"""
-        text = "123 Main St UNION SELECT * FROM users"
-        error = detect_injection_attacks(text)
-        assert error is not None
-    
     def test_empty_text_passes(self):
         """Test that empty text passes"""
         error = detect_injection_attacks("")
@@ -156,37 +118,19 @@ class TestInappropriateContentDetection:
         error = detect_inappropriate_content(text)
         assert error is None
     
-    def test_explicit_content_detected(self):
-        """Test that explicit content is detected"""
-        text = "123 Main St, explicit content here"
+    @pytest.mark.parametrize("text", [
+        "123 Main St, explicit content here",  # Explicit content
+        "123 Main St, hate speech here",  # Hate speech
+        "123 Main St, violence and threats",  # Violent content
+        "123 Main St, scam and fraud",  # Scam content
+        "123 Main St, EXPLICIT content",  # Case-insensitive match
+    ])
+    def test_inappropriate_content_detected(self, text):
+        """Test that explicit, hateful, violent and scam content is detected"""
         error = detect_inappropriate_content(text)
         assert error is not None
         assert "inappropriate content" in error.lower()
     
-    def test_hate_speech_detected(self):
-        """Test that hate speech is detected"""
-        text = "123 Main St, hate speech here"
-        error = detect_inappropriate_content(text)
-        assert error is not None
-    
-    def test_violent_content_detected(self):
-        """Test that violent content is detected"""
-        text = "123 Main St, violence and threats"
-        error = detect_inappropriate_content(text)
-        assert error is not None
-    
-    def test_scam_content_detected(self):
-        """Test that scam content is detected"""
-        text = "123 Main St, scam and fraud"
-        error = detect_inappropriate_content(text)
-        assert error is not None
-    
-    def test_case_insensitive_detection(self):
-        """Test that inappropriate content detection is case-insensitive"""
-        text = "123 Main St, EXPLICIT content"
-        error = detect_inappropriate_content(text)
-        assert error is not None
-    
     def test_empty_text_passes(self):
         """Test that empty text passes"""
         error = detect_inappropriate_content("")
@@ -308,6 +252,15 @@ class TestComprehensiveInputGuardrails:
         )
         assert len(errors) >= 2
     
+    def test_oversized_field_skips_content_scans(self):
+        """Test that an oversized field only reports its length error"""
+        errors = check_input_guardrails(
+            address="123 Main St",
+            notes="scam; DROP TABLE users -- " + "A" * MAX_NOTES_LENGTH
+        )
+        assert len(errors) == 1
+        assert "Notes" in errors[0] and "exceeds" in errors[0]
+    
     def test_strict_validation_can_be_disabled(self):
         """Test that strict property validation can be disabled"""
         errors = check_input_guardrails(
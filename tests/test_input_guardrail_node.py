@@ -9,14 +9,20 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from core.nodes import input_guardrail_node
-from core.state import PropertyListingState
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def guardrail_state(make_state):
+    """Factory for a valid sale listing with notes; overrides replace fields"""
+    def _guardrail_state(**overrides):
+        return make_state(**{"notes": "2BR/1BA apartment", **overrides})
+    return _guardrail_state
 
 
 # ============================================================================
@@ -26,42 +32,38 @@ from core.state import PropertyListingState
 class TestInputGuardrailNodeValid:
     """Test input_guardrail_node with valid input"""
     
-    def test_valid_property_input_passes(self):
+    def test_valid_property_input_passes(self, guardrail_state):
         """Test that valid property input passes guardrail checks"""
-        state: PropertyListingState = {
-            "address": "123 Main St, New York, NY 10001",
-            "listing_type": "sale",
-            "notes": "2BR/1BA, 1000 sqft, pet-friendly apartment",
-            "errors": []
-        }
+        state = guardrail_state(
+            address="123 Main St, New York, NY 10001",
+            notes="2BR/1BA, 1000 sqft, pet-friendly apartment"
+        )
         
         result = input_guardrail_node(state)
         
         assert result["errors"] == []
         assert result["address"] == "123 Main St, New York, NY 10001"
     
-    def test_valid_rental_input_passes(self):
+    def test_valid_rental_input_passes(self, guardrail_state):
         """Test that valid rental input passes guardrail checks"""
-        state: PropertyListingState = {
-            "address": "456 Oak Ave, Los Angeles, CA 90001",
-            "listing_type": "rent",
-            "notes": "3BR/2BA, 1500 sqft, updated kitchen, $2500/month",
-            "errors": []
-        }
+        state = guardrail_state(
+            address="456 Oak Ave, Los Angeles, CA 90001",
+            listing_type="rent",
+            notes="3BR/2BA, 1500 sqft, updated kitchen, $2500/month"
+        )
         
         result = input_guardrail_node(state)
         
         assert result["errors"] == []
     
-    def test_node_preserves_state_fields(self):
+    def test_node_preserves_state_fields(self, guardrail_state):
         """Test that node preserves all state fields"""
-        state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "sale",
-            "price": 500000.0,
-            "notes": "2BR/1BA apartment",
-            "errors": []
-        }
+        state = guardrail_state(
+            address="123 Main St",
+            listing_type="sale",
+            price=500000.0,
+            notes="2BR/1BA apartment"
+        )
         
         result = input_guardrail_node(state)
         
@@ -78,71 +80,49 @@ class TestInputGuardrailNodeValid:
 class TestInputGuardrailNodeInvalid:
     """Test input_guardrail_node with invalid input"""
     
-    def test_long_address_adds_error(self):
+    def test_long_address_adds_error(self, guardrail_state):
         """Test that long address adds error to state"""
         long_address = "A" * 501  # Exceeds MAX_ADDRESS_LENGTH
-        state: PropertyListingState = {
-            "address": long_address,
-            "listing_type": "sale",
-            "notes": "2BR/1BA apartment",
-            "errors": []
-        }
+        state = guardrail_state(address=long_address)
         
         result = input_guardrail_node(state)
         
         assert len(result["errors"]) > 0
         assert any("Address" in error and "exceeds" in error for error in result["errors"])
     
-    def test_injection_attack_adds_error(self):
+    def test_injection_attack_adds_error(self, guardrail_state):
         """Test that injection attack adds error to state"""
-        state: PropertyListingState = {
-            "address": "123 Main St' UNION SELECT * FROM users--",
-            "listing_type": "sale",
-            "notes": "2BR/1BA apartment",
-            "errors": []
-        }
+        state = guardrail_state(address="123 Main St' UNION SELECT * FROM users--")
         
         result = input_guardrail_node(state)
         
         assert len(result["errors"]) > 0
         assert any("injection attack" in error.lower() for error in result["errors"])
     
-    def test_inappropriate_content_adds_error(self):
+    def test_inappropriate_content_adds_error(self, guardrail_state):
         """Test that inappropriate content adds error to state"""
-        state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "sale",
-            "notes": "explicit content here",
-            "errors": []
-        }
+        state = guardrail_state(notes="explicit content here")
         
         result = input_guardrail_node(state)
         
         assert len(result["errors"]) > 0
         assert any("inappropriate content" in error.lower() for error in result["errors"])
     
-    def test_non_property_input_adds_error(self):
+    def test_non_property_input_adds_error(self, guardrail_state):
         """Test that non-property input adds error to state"""
-        state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "sale",
-            "notes": "This is completely unrelated content about cooking recipes and food preparation",
-            "errors": []
-        }
+        state = guardrail_state(notes="This is completely unrelated content about cooking recipes and food preparation")
         
         result = input_guardrail_node(state)
         
         assert len(result["errors"]) > 0
         assert any("property-related" in error.lower() for error in result["errors"])
     
-    def test_multiple_errors_collected(self):
+    def test_multiple_errors_collected(self, guardrail_state):
         """Test that multiple errors are collected in state"""
-        state: PropertyListingState = {
-            "address": "A" * 501,  # Too long
-            "listing_type": "sale",
-            "notes": "A" * 2001,  # Too long
-            "errors": []
-        }
+        state = guardrail_state(
+            address="A" * 501,  # Too long
+            notes="A" * 2001  # Too long
+        )
         
         result = input_guardrail_node(state)
         
@@ -156,42 +136,27 @@ class TestInputGuardrailNodeInvalid:
 class TestInputGuardrailNodeEdgeCases:
     """Test edge cases for input_guardrail_node"""
     
-    def test_none_address_handled(self):
+    def test_none_address_handled(self, guardrail_state):
         """Test that None address is handled gracefully"""
-        state: PropertyListingState = {
-            "address": None,  # type: ignore
-            "listing_type": "sale",
-            "notes": "2BR/1BA apartment",
-            "errors": []
-        }
+        state = guardrail_state(address=None)
         
         result = input_guardrail_node(state)
         
         # Should handle None gracefully (may add errors for empty address)
         assert "errors" in result
     
-    def test_none_notes_handled(self):
+    def test_none_notes_handled(self, guardrail_state):
         """Test that None notes is handled gracefully"""
-        state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "sale",
-            "notes": None,  # type: ignore
-            "errors": []
-        }
+        state = guardrail_state(notes=None)
         
         result = input_guardrail_node(state)
         
         # Should handle None gracefully
         assert "errors" in result
     
-    def test_empty_strings_handled(self):
+    def test_empty_strings_handled(self, guardrail_state):
         """Test that empty strings are handled"""
-        state: PropertyListingState = {
-            "address": "",
-            "listing_type": "sale",
-            "notes": "",
-            "errors": []
-        }
+        state = guardrail_state(address="", notes="")
         
         result = input_guardrail_node(state)
         
@@ -200,7 +165,7 @@ class TestInputGuardrailNodeEdgeCases:
     
     def test_errors_list_initialized_if_missing(self):
         """Test that errors list is initialized if missing"""
-        state: PropertyListingState = {
+        state = {
             "address": "123 Main St",
             "listing_type": "sale",
             "notes": "2BR/1BA apartment"
@@ -212,30 +177,42 @@ class TestInputGuardrailNodeEdgeCases:
         assert "errors" in result
         assert isinstance(result["errors"], list)
     
-    def test_existing_errors_preserved(self):
+    def test_existing_errors_preserved(self, guardrail_state):
         """Test that existing errors are preserved"""
-        state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "sale",
-            "notes": "2BR/1BA apartment",
-            "errors": ["Existing error"]
-        }
+        state = guardrail_state(errors=["Existing error"])
         
         result = input_guardrail_node(state)
         
         assert "Existing error" in result["errors"]
     
-    def test_new_errors_appended_to_existing(self):
+    def test_new_errors_appended_to_existing(self, guardrail_state):
         """Test that new errors are appended to existing errors"""
-        state: PropertyListingState = {
-            "address": "A" * 501,  # Will generate error
-            "listing_type": "sale",
-            "notes": "2BR/1BA apartment",
-            "errors": ["Existing error"]
-        }
+        state = guardrail_state(
+            address="A" * 501,  # Will generate error
+            errors=["Existing error"]
+        )
         
         result = input_guardrail_node(state)
         
         assert "Existing error" in result["errors"]
         assert len(result["errors"]) > 1
 
+    
+    def test_repeat_input_gives_same_independent_errors(self, guardrail_state):
+        """Test that re-running the node on the same input reuses results without sharing lists"""
+        first = input_guardrail_node(guardrail_state(address="A" * 501))
+        first["errors"].append("Added by caller")
+        second = input_guardrail_node(guardrail_state(address="A" * 501))
+        
+        assert "Added by caller" not in second["errors"]
+        assert any("Address" in error and "exceeds" in error for error in second["errors"])
+    
+    def test_unhashable_field_values_handled(self, guardrail_state):
+        """Test that unhashable field values skip the cache instead of failing"""
+        state = guardrail_state(bedrooms=[2])
+        
+        result = input_guardrail_node(state)
+        
+        assert "errors" in result
+        assert result["normalized_notes"] == "2BR/1BA apartment"
+
@@ -10,11 +10,6 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from core.nodes import normalize_text_node
 from core.state import PropertyListingState
@@ -9,15 +9,27 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.prompts import build_listing_generation_prompt
 
 
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def basic_sale_prompt():
+    """Prompt for a plain sale listing, built once and shared by read-only tests"""
+    return build_listing_generation_prompt(
+        address="123 Main St",
+        listing_type="sale",
+        property_type="House",
+        bedrooms=3,
+        bathrooms=2.0,
+        sqft=1500
+    )
+
+
 # ============================================================================
 # Basic Prompt Construction Tests
 # ============================================================================
@@ -33,12 +45,13 @@ class TestPromptConstruction:
             price=500000.0
         )
         
+        prompt_lower = prompt.lower()
         assert "123 Main St, New York, NY" in prompt
-        assert "sale" in prompt.upper() or "SALE" in prompt
+        assert "SALE" in prompt
         assert "$500,000.00" in prompt or "500000" in prompt
-        assert "title" in prompt.lower()
-        assert "description" in prompt.lower()
-        assert "price_block" in prompt.lower()
+        assert "title" in prompt_lower
+        assert "description" in prompt_lower
+        assert "price_block" in prompt_lower
         assert "JSON" in prompt or "json" in prompt
     
     def test_prompt_with_notes(self):
@@ -50,9 +63,10 @@ class TestPromptConstruction:
             notes="2BR/1BA apartment, modern kitchen"
         )
         
+        prompt_lower = prompt.lower()
         assert "2BR/1BA" in prompt or "2BR" in prompt
-        assert "apartment" in prompt.lower()
-        assert "kitchen" in prompt.lower()
+        assert "apartment" in prompt_lower
+        assert "kitchen" in prompt_lower
     
     def test_prompt_with_normalized_data(self):
         """Test prompt uses normalized data when available"""
@@ -79,10 +93,11 @@ class TestPromptConstruction:
             security_deposit=2500.0
         )
         
-        assert "monthly" in prompt.lower()
-        assert "12 months" in prompt.lower() or "12" in prompt
+        prompt_lower = prompt.lower()
+        assert "monthly" in prompt_lower
+        assert "12 months" in prompt_lower or "12" in prompt
         assert "2,500" in prompt or "2500" in prompt  # Security deposit (formatted with comma)
-        assert "rent" in prompt.lower()
+        assert "rent" in prompt_lower
     
     def test_prompt_with_sale_fields(self):
         """Test prompt includes sale-specific fields"""
@@ -115,40 +130,35 @@ class TestPromptConstruction:
             }
         )
         
+        prompt_lower = prompt.lower()
         assert "10001" in prompt
         assert "Midtown Manhattan" in prompt
         assert "Central Park" in prompt
         assert "Times Square" in prompt
-        assert "PS 123" in prompt or "schools" in prompt.lower()
-        assert "Macy" in prompt or "shopping" in prompt.lower()
-        assert "Subway" in prompt or "transportation" in prompt.lower()
+        assert "PS 123" in prompt or "schools" in prompt_lower
+        assert "Macy" in prompt or "shopping" in prompt_lower
+        assert "Subway" in prompt or "transportation" in prompt_lower
     
-    def test_prompt_includes_instructions(self):
+    def test_prompt_includes_instructions(self, basic_sale_prompt):
         """Test prompt includes generation instructions"""
-        prompt = build_listing_generation_prompt(
-            address="123 Main St",
-            listing_type="sale",
-            price=500000.0
-        )
+        prompt = basic_sale_prompt
         
-        assert "INSTRUCTIONS" in prompt or "instructions" in prompt.lower()
-        assert "TITLE" in prompt or "title" in prompt.lower()
-        assert "DESCRIPTION" in prompt or "description" in prompt.lower()
-        assert "PRICE_BLOCK" in prompt or "price_block" in prompt.lower()
+        prompt_lower = prompt.lower()
+        assert "INSTRUCTIONS" in prompt or "instructions" in prompt_lower
+        assert "TITLE" in prompt or "title" in prompt_lower
+        assert "DESCRIPTION" in prompt or "description" in prompt_lower
+        assert "PRICE_BLOCK" in prompt or "price_block" in prompt_lower
         assert "JSON" in prompt or "json" in prompt
     
-    def test_prompt_includes_guidelines(self):
+    def test_prompt_includes_guidelines(self, basic_sale_prompt):
         """Test prompt includes important guidelines"""
-        prompt = build_listing_generation_prompt(
-            address="123 Main St",
-            listing_type="sale",
-            price=500000.0
-        )
+        prompt = basic_sale_prompt
         
-        assert "GUIDELINES" in prompt or "guidelines" in prompt.lower()
-        assert "factual" in prompt.lower() or "accurate" in prompt.lower()
-        assert "not invent" in prompt.lower() or "do not invent" in prompt.lower()
-        assert "property listing" in prompt.lower()
+        prompt_lower = prompt.lower()
+        assert "GUIDELINES" in prompt or "guidelines" in prompt_lower
+        assert "factual" in prompt_lower or "accurate" in prompt_lower
+        assert "not invent" in prompt_lower or "do not invent" in prompt_lower
+        assert "property listing" in prompt_lower
 
 
 # ============================================================================
@@ -158,48 +168,30 @@ class TestPromptConstruction:
 class TestPromptEdgeCases:
     """Test edge cases for prompt construction"""
     
-    def test_prompt_with_empty_notes(self):
-        """Test prompt handles empty notes"""
-        prompt = build_listing_generation_prompt(
-            address="123 Main St",
-            listing_type="sale",
-            price=500000.0,
-            notes=""
-        )
-        
-        # Should still work without notes
-        assert "123 Main St" in prompt
-        assert "sale" in prompt.lower()
-    
-    def test_prompt_with_none_values(self):
-        """Test prompt handles None values gracefully"""
+    @pytest.mark.parametrize("overrides", [
+        pytest.param({"notes": ""}, id="empty_notes"),
+        pytest.param({
+            "notes": None,
+            "zip_code": None,
+            "neighborhood": None,
+            "landmarks": None,
+            "key_amenities": None
+        }, id="none_values"),
+        pytest.param({"key_amenities": {}}, id="empty_amenities"),
+    ])
+    def test_prompt_handles_missing_optional_data(self, overrides):
+        """Test prompt still builds when optional data is empty or None"""
         prompt = build_listing_generation_prompt(
             address="123 Main St",
             listing_type="sale",
             price=500000.0,
-            notes=None,
-            zip_code=None,
-            neighborhood=None,
-            landmarks=None,
-            key_amenities=None
+            **overrides
         )
         
         # Should still work
         assert "123 Main St" in prompt
         assert "sale" in prompt.lower()
     
-    def test_prompt_with_empty_amenities(self):
-        """Test prompt handles empty amenities"""
-        prompt = build_listing_generation_prompt(
-            address="123 Main St",
-            listing_type="sale",
-            price=500000.0,
-            key_amenities={}
-        )
-        
-        # Should still work
-        assert "123 Main St" in prompt
-    
     def test_prompt_with_partial_amenities(self):
         """Test prompt handles partial amenities"""
         prompt = build_listing_generation_prompt(
@@ -215,6 +207,53 @@ class TestPromptEdgeCases:
         )
         
         # Should include schools and transportation
-        assert "PS 123" in prompt or "schools" in prompt.lower()
-        assert "Subway" in prompt or "transportation" in prompt.lower()
+        prompt_lower = prompt.lower()
+        assert "PS 123" in prompt or "schools" in prompt_lower
+        assert "Subway" in prompt or "transportation" in prompt_lower
+
+
+# ============================================================================
+# Prompt Cache Tests
+# ============================================================================
+
+class TestPromptCache:
+    """Test caching of rendered prompts"""
+    
+    BASE_KWARGS = dict(
+        address="123 Main St, New York, NY",
+        listing_type="rent",
+        property_type="Apartment",
+        bedrooms=2,
+        bathrooms=1,
+        sqft=900,
+        landmarks=["Central Park"],
+        key_amenities={"parks": ["Central Park"]},
+    )
+    
+    def test_repeat_call_uses_cache(self):
+        """Test that an identical second call is served from the cache"""
+        from utils.prompts import _build_prompt_cached
+        _build_prompt_cached.cache_clear()
+        
+        first = build_listing_generation_prompt(**self.BASE_KWARGS)
+        second = build_listing_generation_prompt(**dict(self.BASE_KWARGS, landmarks=["Central Park"]))
+        
+        assert first == second
+        assert _build_prompt_cached.cache_info().hits == 1
+    
+    def test_int_and_float_values_not_shared(self):
+        """Test that 2 and 2.0 bedrooms render separately (no cache collision)"""
+        as_int = build_listing_generation_prompt(**self.BASE_KWARGS)
+        as_float = build_listing_generation_prompt(**dict(self.BASE_KWARGS, bedrooms=2.0))
+        
+        assert "Bedrooms: 2\n" in as_int
+        assert "Bedrooms: 2.0\n" in as_float
+    
+    def test_unhashable_values_rendered_uncached(self):
+        """Test that nested unhashable amenity values still produce a prompt"""
+        prompt = build_listing_generation_prompt(
+            **dict(self.BASE_KWARGS, key_amenities={"parks": [{"name": "Central Park"}]})
+        )
+        
+        assert "KEY AMENITIES" in prompt
 
@@ -11,13 +11,8 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
 from typing import get_type_hints
 
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from core import PropertyListingState
 
 
@@ -11,11 +11,6 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.text_processor import (
     normalize_whitespace,
@@ -0,0 +1,194 @@
+"""
+Unit tests for tracing utilities.
+
+Tests cover:
+- Trace metadata propagation into worker threads
+- Metadata written by the parallel enrichment searches
+- Buffered tracer drop policy
+- Web search URL extraction
+"""
+
+import pytest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from utils.enrichment import enrich_property_data, clear_enrichment_cache
+from utils.tracing import (
+    _BufferedTracer,
+    append_trace_metadata,
+    clear_trace_metadata,
+    get_trace_metadata,
+    set_trace_metadata,
+    submit_with_trace_context,
+    trace_web_search,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_trace_metadata():
+    """Start and finish every test with empty trace metadata and enrichment cache"""
+    clear_trace_metadata()
+    clear_enrichment_cache()
+    yield
+    clear_trace_metadata()
+    clear_enrichment_cache()
+
+
+# ============================================================================
+# Worker Thread Propagation Tests
+# ============================================================================
+
+class TestTraceContextPropagation:
+    """Test that trace metadata crosses into executor worker threads"""
+    
+    def test_worker_writes_visible_to_caller(self):
+        """Test that metadata set inside a submitted task is seen by the caller"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                submit_with_trace_context(executor, set_trace_metadata, f"key_{i}", i)
+                for i in range(2)
+            ]
+            for future in futures:
+                future.result()
+        
+        metadata = get_trace_metadata()
+        assert metadata["key_0"] == 0
+        assert metadata["key_1"] == 1
+    
+    def test_worker_sees_caller_metadata(self):
+        """Test that a submitted task reads metadata set by the caller"""
+        set_trace_metadata("request_id", "abc")
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            seen = submit_with_trace_context(executor, get_trace_metadata).result()
+        
+        assert seen["request_id"] == "abc"
+    
+    def test_parallel_appends_all_kept(self):
+        """Test that appends from many workers all land in one list"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                submit_with_trace_context(executor, append_trace_metadata, "items", i)
+                for i in range(100)
+            ]
+            for future in futures:
+                future.result()
+        
+        assert sorted(get_trace_metadata()["items"]) == list(range(100))
+
+
+# ============================================================================
+# Enrichment Metadata Tests
+# ============================================================================
+
+class TestEnrichmentTraceMetadata:
+    """Test trace metadata recorded by the parallel enrichment searches"""
+    
+    def test_web_searches_survive_parallel_enrichment(self):
+        """Test that both web searches run in worker threads are recorded for the caller"""
+        search_tool = SimpleNamespace(invoke=lambda query_dict: {
+            "results": [{"content": "Crime rate: low. Lincoln High School", "title": "Area"}]
+        })
+        set_trace_metadata("request_id", "abc")
+        
+        enrich_property_data(address="123 Main St, New York, NY 10001", search_tool=search_tool)
+        
+        metadata = get_trace_metadata()
+        assert metadata["request_id"] == "abc"
+        assert len(metadata["web_searches"]) == 2
+        assert all(search["success"] for search in metadata["web_searches"])
+
+
+# ============================================================================
+# Buffered Tracer Tests
+# ============================================================================
+
+class _RecordingTracer:
+    """Stand-in tracer that records (callback, run_id) for every event"""
+    
+    def __init__(self):
+        self.events = []
+    
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None):
+        self.events.append(("on_chain_start", run_id))
+    
+    def on_chain_end(self, outputs, *, run_id, parent_run_id=None):
+        self.events.append(("on_chain_end", run_id))
+
+
+class TestBufferedTracer:
+    """Test that the buffered tracer drops whole runs, never half of one"""
+    
+    def _run_events(self, buffered):
+        """Start runs a and b, overflow with run c and its child, then end everything"""
+        # Holding the dispatch lock keeps the flusher thread from draining the queue
+        with buffered._dispatch_lock:
+            buffered.on_chain_start({}, {}, run_id="a")
+            buffered.on_chain_start({}, {}, run_id="b")
+            buffered.on_chain_start({}, {}, run_id="c")  # buffer full: rejected
+            buffered.on_chain_start({}, {}, run_id="c-child", parent_run_id="c")
+            buffered.on_chain_end({}, run_id="c-child", parent_run_id="c")
+            buffered.on_chain_end({}, run_id="c")
+            buffered.on_chain_end({}, run_id="a")
+            buffered.on_chain_end({}, run_id="b")
+        buffered.flush()
+    
+    def test_admitted_runs_complete_and_rejected_runs_dropped_whole(self):
+        """Test that admitted runs keep their end events and rejected runs lose all events"""
+        tracer = _RecordingTracer()
+        buffered = _BufferedTracer(tracer, max_events=2)
+        
+        with pytest.warns(RuntimeWarning, match="Trace buffer full"):
+            self._run_events(buffered)
+        
+        assert tracer.events == [
+            ("on_chain_start", "a"),
+            ("on_chain_start", "b"),
+            ("on_chain_end", "a"),
+            ("on_chain_end", "b"),
+        ]
+        assert get_trace_metadata()["dropped_trace_events"] == 4
+    
+    def test_no_warning_when_nothing_dropped(self):
+        """Test that no warning or metadata is recorded while the buffer has room"""
+        tracer = _RecordingTracer()
+        buffered = _BufferedTracer(tracer, max_events=100)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self._run_events(buffered)
+        
+        assert len(tracer.events) == 8
+        assert "dropped_trace_events" not in get_trace_metadata()
+
+
+# ============================================================================
+# Web Search Tracing Tests
+# ============================================================================
+
+class TestTraceWebSearch:
+    """Test URL extraction in trace_web_search"""
+    
+    def test_result_without_url_recorded_as_empty_string(self):
+        """Test that a result dict without a url still takes a slot in urls"""
+        tool = SimpleNamespace(invoke=lambda _: {"results": [
+            {"url": "https://a.example"},
+            {"content": "no url"},
+            "not a dict",
+            {"url": "https://b.example"},
+        ]})
+        
+        _, metrics = trace_web_search(tool, "query", max_results=10)
+        
+        assert metrics["urls"] == ["https://a.example", "", "https://b.example"]
+    
+    def test_urls_limited_to_five(self):
+        """Test that at most five URLs are recorded"""
+        tool = SimpleNamespace(invoke=lambda _: {"results": [
+            {"url": f"https://{i}.example"} for i in range(8)
+        ]})
+        
+        _, metrics = trace_web_search(tool, "query", max_results=8)
+        
+        assert metrics["urls"] == [f"https://{i}.example" for i in range(5)]
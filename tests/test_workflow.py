@@ -10,120 +10,105 @@ Tests cover:
 """
 
 import pytest
-import sys
-from pathlib import Path
+from types import MappingProxyType
 
-# Add src to path so we can import
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core import create_workflow, PropertyListingState
+# User-defined nodes the workflow must register
+REQUIRED_NODES = frozenset({
+    "input_guardrail",
+    "validate_input",
+    "normalize_text",
+    "enrich_data",
+    "generate_content",
+    "output_guardrail",
+    "format_output",
+})
 
 
 class TestWorkflowStructure:
     """Test the workflow graph structure"""
     
-    def test_workflow_creation(self):
+    def test_workflow_creation(self, workflow):
         """Test that workflow can be created"""
-        workflow = create_workflow()
         assert workflow is not None
     
-    def test_workflow_is_compiled(self):
+    def test_workflow_is_compiled(self, workflow):
         """Test that workflow is a compiled graph"""
-        workflow = create_workflow()
         # Check that workflow has invoke method (indicates it's compiled)
-        assert hasattr(workflow, 'invoke')
-        assert callable(workflow.invoke)
+        assert callable(getattr(workflow, 'invoke', None))
     
-    def test_workflow_has_nodes(self):
+    def test_workflow_has_nodes(self, workflow):
         """Test that workflow has all required nodes"""
-        workflow = create_workflow()
-        nodes = workflow.nodes
-        assert "input_guardrail" in nodes
-        assert "validate_input" in nodes
-        assert "normalize_text" in nodes
-        assert "enrich_data" in nodes
-        assert "generate_content" in nodes
-        assert "output_guardrail" in nodes
-        assert "format_output" in nodes
+        # Set difference reports every missing node at once
+        missing = REQUIRED_NODES - workflow.nodes.keys()
+        assert not missing, f"Missing nodes: {sorted(missing)}"
     
-    def test_workflow_node_count(self):
+    def test_workflow_node_count(self, workflow):
         """Test that workflow has exactly 7 user-defined nodes (plus __start__ node)"""
-        workflow = create_workflow()
         # When using set_entry_point(), LangGraph adds __start__ node internally
         # So we have 7 user nodes + 1 internal __start__ node = 8 total
         assert len(workflow.nodes) == 8
         # Verify all our user-defined nodes are present
-        user_nodes = [n for n in workflow.nodes.keys() if n != "__start__"]
-        assert len(user_nodes) == 7
+        user_node_count = len(workflow.nodes.keys() - {"__start__"})
+        assert user_node_count == 7
+
+
+# Read-only initial states for the execution tests, each invoked once by the
+# test that uses it (errors is left out here and given a fresh list per
+# invocation)
+MINIMAL_SALE_STATE = MappingProxyType({"address": "123 Main St, New York, NY 10001", "listing_type": "sale"})
+MINIMAL_RENT_STATE = MappingProxyType({"address": "123 Main St", "listing_type": "rent"})
+FULL_SALE_STATE = MappingProxyType({"address": "456 Oak Ave", "listing_type": "sale", "price": 500000.0, "notes": "3BR/2BA"})
+
+
+@pytest.fixture(scope="module")
+def runnable_workflow(workflow):
+    """The workflow, or a single skip for every execution test if it cannot be invoked"""
+    if not callable(getattr(workflow, "invoke", None)):
+        pytest.skip(f"Workflow cannot be invoked (got {type(workflow).__name__})")
+    return workflow
+
+
+@pytest.fixture(scope="module")
+def invocation_result(runnable_workflow, request):
+    """(initial_state, result) from invoking the workflow on the test's initial state"""
+    initial_state = request.param
+    try:
+        result = runnable_workflow.invoke({**initial_state, "errors": []})
+    except Exception as e:
+        # If nodes aren't implemented yet, that's expected
+        # We just want to verify the structure is correct
+        pytest.skip(f"Workflow structure is correct, but nodes need implementation: {e}")
+    return initial_state, result
 
 
 class TestWorkflowExecution:
     """Test workflow execution with minimal state"""
     
-    def test_workflow_executes_with_minimal_state(self):
+    @pytest.mark.parametrize("invocation_result", [MINIMAL_SALE_STATE], indirect=True, ids=["minimal_sale"])
+    def test_workflow_executes_with_minimal_state(self, invocation_result):
         """Test that workflow can execute with minimal required state"""
-        workflow = create_workflow()
-        
-        # Create minimal state with required fields
-        initial_state: PropertyListingState = {
-            "address": "123 Main St, New York, NY 10001",
-            "listing_type": "sale",
-            "errors": []
-        }
-        
-        # Execute workflow (will run through all nodes, even if they're placeholders)
-        try:
-            result = workflow.invoke(initial_state)
-            # Workflow should complete (even if nodes are placeholders)
-            assert result is not None
-            assert "address" in result
-            assert "listing_type" in result
-        except Exception as e:
-            # If nodes aren't implemented yet, that's expected
-            # We just want to verify the structure is correct
-            pytest.skip(f"Workflow structure is correct, but nodes need implementation: {e}")
+        _, result = invocation_result
+        # Workflow should complete (even if nodes are placeholders)
+        assert result is not None
+        assert "address" in result
+        assert "listing_type" in result
     
-    def test_workflow_preserves_required_fields(self):
+    @pytest.mark.parametrize("invocation_result", [MINIMAL_RENT_STATE], indirect=True, ids=["minimal_rent"])
+    def test_workflow_preserves_required_fields(self, invocation_result):
         """Test that workflow preserves required fields through execution"""
-        workflow = create_workflow()
-        
-        initial_state: PropertyListingState = {
-            "address": "123 Main St",
-            "listing_type": "rent",
-            "errors": []
-        }
-        
-        try:
-            result = workflow.invoke(initial_state)
-            assert result["address"] == "123 Main St"
-            assert result["listing_type"] == "rent"
-        except Exception:
-            pytest.skip("Nodes need implementation")
+        initial_state, result = invocation_result
+        assert result["address"] == initial_state["address"]
+        assert result["listing_type"] == initial_state["listing_type"]
 
 
 class TestWorkflowStateFlow:
     """Test that state flows correctly through workflow"""
     
-    def test_state_structure_maintained(self):
+    @pytest.mark.parametrize("invocation_result", [FULL_SALE_STATE], indirect=True, ids=["sale_with_price_and_notes"])
+    def test_state_structure_maintained(self, invocation_result):
         """Test that state structure is maintained through workflow"""
-        workflow = create_workflow()
-        
-        initial_state: PropertyListingState = {
-            "address": "456 Oak Ave",
-            "listing_type": "sale",
-            "price": 500000.0,
-            "notes": "3BR/2BA",
-            "errors": []
-        }
-        
-        try:
-            result = workflow.invoke(initial_state)
-            # State should maintain all fields
-            assert "address" in result
-            assert "listing_type" in result
-            assert "price" in result
-            assert "notes" in result
-            assert "errors" in result
-        except Exception:
-            pytest.skip("Nodes need implementation")
-
+        initial_state, result = invocation_result
+        # State should maintain all fields
+        missing = (initial_state.keys() | {"errors"}) - result.keys()
+        assert not missing, f"Missing fields: {sorted(missing)}"